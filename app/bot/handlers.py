@@ -33,6 +33,7 @@ from app.services.stores.confirmation_store import ConfirmationStore
 from app.services.stores.idempotency_store import IdempotencyStore
 from app.services.stores.pending_action_store import PendingAction, PendingActionStore
 from app.services.stores.quick_action_store import QuickActionStore
+from app.services.stores.session_state_store import SessionStateStore
 
 logger = structlog.get_logger(__name__)
 router = Router()
@@ -499,6 +500,7 @@ async def voice_handler(message: Message, container: AppContainer, session: Asyn
             telegram_id=message.from_user.id,
             language=(message.from_user.language_code or "ru"),
             text=text,
+            pending=await PendingActionStore(container.redis).get(message.from_user.id),
             sink=message,
         ):
             return
@@ -528,7 +530,8 @@ async def voice_handler(message: Message, container: AppContainer, session: Asyn
 async def text_handler(message: Message, container: AppContainer, session: AsyncSession) -> None:
     if message.from_user is None or message.text is None:
         return
-    if not await _register_message_once(message, container, kind="text"):
+    claimed, pending = await _claim_message_and_load_pending(message, container, kind="text")
+    if not claimed:
         return
 
     with bound_contextvars(
@@ -549,6 +552,7 @@ async def text_handler(message: Message, container: AppContainer, session: Async
             telegram_id=message.from_user.id,
             language=(message.from_user.language_code or "ru"),
             text=message.text,
+            pending=pending,
             sink=message,
         ):
             return
@@ -575,12 +579,12 @@ async def _try_handle_pending(
     language: str,
     text: str,
     sink: Message | InaccessibleMessage,
+    pending: PendingAction | None,
 ) -> bool:
-    pending_store = PendingActionStore(container.redis)
-    pending = await pending_store.get(telegram_id)
     if pending is None:
         return False
 
+    pending_store = PendingActionStore(container.redis)
     user_repo = UserRepository(session)
     await user_repo.get_or_create(telegram_id, language=language)
 
@@ -825,12 +829,28 @@ def _build_event_service(session: AsyncSession, container: AppContainer | None =
     )
 
 
+def _message_idem_key(message: Message, kind: str, telegram_id: int) -> str:
+    return f"msg:{kind}:{telegram_id}:{message.chat.id}:{message.message_id}"
+
+
 async def _register_message_once(message: Message, container: AppContainer, kind: str) -> bool:
     if message.from_user is None:
         return True
-    key = f"msg:{kind}:{message.from_user.id}:{message.chat.id}:{message.message_id}"
     store = IdempotencyStore(container.redis)
-    return await store.register_once(key)
+    return await store.register_once(_message_idem_key(message, kind, message.from_user.id))
+
+
+async def _claim_message_and_load_pending(
+    message: Message,
+    container: AppContainer,
+    kind: str,
+) -> tuple[bool, PendingAction | None]:
+    # Same claim as _register_message_once, with the pending action fetched in the same round-trip.
+    if message.from_user is None:
+        return True, None
+    store = SessionStateStore(container.redis)
+    telegram_id = message.from_user.id
+    return await store.claim_and_load_pending(_message_idem_key(message, kind, telegram_id), telegram_id)
 
 
 async def _register_callback_once(callback: CallbackQuery, container: AppContainer) -> bool:
@@ -30,6 +30,8 @@ class Settings(BaseSettings):
 
     llm_base_url: str = Field(default="http://localhost:8100", alias="LLM_BASE_URL")
     llm_api_key: str = Field(default="", alias="LLM_API_KEY")
+    llm_cache_max_entries: int = Field(default=4096, alias="LLM_CACHE_MAX_ENTRIES")
+    llm_cache_ttl_seconds: float = Field(default=600.0, alias="LLM_CACHE_TTL_SECONDS")
     stt_base_url: str = Field(default="http://localhost:8200", alias="STT_BASE_URL")
     stt_api_key: str = Field(default="", alias="STT_API_KEY")
 
@@ -49,6 +49,7 @@ class AppContainer:
     llm_client: LLMClient
     stt_client: STTClient
     notifier: Notifier
+    cached_llm_client: LLMClient | None = None
 
     def _create_event_service(self, session: AsyncSession) -> EventService:
         event_repo = EventRepository(session)
@@ -73,8 +74,12 @@ class AppContainer:
 
     def create_assistant_service(self, session: AsyncSession) -> AssistantService:
         user_repo = UserRepository(session)
-        trace_repo = AgentRunTraceRepository(session)
-        parser = CommandParserService(self.llm_client, trace_repository=trace_repo)
+        trace_repo = AgentRunTraceRepository(session, flush_every=16)
+        parser = CommandParserService(
+            self.llm_client,
+            trace_repository=trace_repo,
+            cached_llm_client=self.cached_llm_client,
+        )
         event_service = self._create_event_service(session)
         response_renderer = self.create_bot_response_service()
         dialog_state_store = DialogStateStore(self.redis)
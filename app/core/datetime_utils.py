@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime, time, timedelta
+from datetime import UTC, date, datetime, time, timedelta
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 import dateparser
 from dateutil import parser as dateutil_parser
 
 
+@lru_cache(maxsize=64)
+def _zone(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
 def ensure_utc(dt: datetime) -> datetime:
     if dt.tzinfo is None:
         return dt.replace(tzinfo=UTC)
@@ -20,7 +26,7 @@ def parse_datetime_input(value: str, timezone: str, languages: list[str] | None
     except (ValueError, TypeError):
         pass
 
-    relative_base = datetime.now(tz=ZoneInfo(timezone))
+    relative_base = datetime.now(tz=_zone(timezone))
     parsed = dateparser.parse(
         value,
         languages=languages,
@@ -36,6 +42,18 @@ def parse_datetime_input(value: str, timezone: str, languages: list[str] | None
     return ensure_utc(parsed)
 
 
+def parse_local_iso(date_text: str, time_text: str, timezone: str) -> datetime | None:
+    # Fast path for the YYYY-MM-DD / HH:MM pairs that quick-pick buttons send in local time.
+    try:
+        day = date.fromisoformat(date_text)
+        clock = time.fromisoformat(time_text)
+    except ValueError:
+        return None
+    if clock.tzinfo is not None:
+        return None
+    return datetime.combine(day, clock, tzinfo=_zone(timezone)).astimezone(UTC)
+
+
 def parse_date_input(value: str, timezone: str, languages: list[str] | None = None) -> datetime | None:
     parsed = dateparser.parse(
         value,
@@ -52,7 +70,7 @@ def parse_date_input(value: str, timezone: str, languages: list[str] | None = No
 
 
 def start_of_local_day(day: datetime, timezone: str) -> datetime:
-    tz = ZoneInfo(timezone)
+    tz = _zone(timezone)
     local_day = day.astimezone(tz)
     start = datetime.combine(local_day.date(), time.min, tzinfo=tz)
     return start.astimezone(UTC)
@@ -69,7 +87,7 @@ def next_weekday_time(weekday: str, hhmm: str, timezone: str, now_utc: datetime
         raise ValueError(msg)
 
     now = now_utc or datetime.now(tz=UTC)
-    tz = ZoneInfo(timezone)
+    tz = _zone(timezone)
     local_now = now.astimezone(tz)
 
     hour, minute = hhmm.split(":")
@@ -85,7 +103,7 @@ def next_weekday_time(weekday: str, hhmm: str, timezone: str, now_utc: datetime
 
 
 def user_now(timezone: str) -> datetime:
-    return datetime.now(tz=UTC).astimezone(ZoneInfo(timezone))
+    return datetime.now(tz=UTC).astimezone(_zone(timezone))
 
 
 def parse_hhmm(value: str) -> time:
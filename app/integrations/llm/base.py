@@ -4,3 +4,7 @@
 class LLMClient(Protocol):
     async def complete(self, prompt: str) -> str:
         ...
+
+    def remember(self, prompt: str, response: str) -> None:
+        # Called once a response has parsed and validated; only caching clients keep it.
+        return None
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from time import monotonic
+
+from app.integrations.llm.base import LLMClient
+
+
+class CachingLLMClient(LLMClient):
+    def __init__(self, inner: LLMClient, max_entries: int = 4096, ttl_seconds: float = 600.0) -> None:
+        self._inner = inner
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[bytes, tuple[float, str]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def cache_stats(self) -> dict[str, int]:
+        return {"hits": self._hits, "misses": self._misses, "size": len(self._entries)}
+
+    def remember(self, prompt: str, response: str) -> None:
+        # A cache hit is remembered again by the caller; keep its original expiry.
+        key = self._key(prompt)
+        if key in self._entries:
+            return
+        self._entries[key] = (monotonic() + self._ttl_seconds, response)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def complete(self, prompt: str) -> str:
+        key = self._key(prompt)
+        now = monotonic()
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > now:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return value
+            del self._entries[key]
+        self._misses += 1
+        # Stored only when the caller calls remember() after validating the response.
+        return await self._inner.complete(prompt)
+
+    @staticmethod
+    def _key(prompt: str) -> bytes:
+        return hashlib.sha256(prompt.encode("utf-8")).digest()
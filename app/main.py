@@ -18,6 +18,7 @@ from app.core.config import get_settings
 from app.core.container import AppContainer
 from app.core.logging import setup_logging
 from app.db.session import create_engine, create_session_factory
+from app.integrations.llm.cache import CachingLLMClient
 from app.integrations.llm.client import HTTPLLMClient
 from app.integrations.stt.client import HTTPSTTClient
 from app.integrations.telegram.notifier import TelegramNotifier
@@ -45,6 +46,11 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         llm_client=llm_client,
         stt_client=stt_client,
         notifier=notifier,
+        cached_llm_client=CachingLLMClient(
+            llm_client,
+            max_entries=settings.llm_cache_max_entries,
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+        ),
     )
 
     bot = Bot(
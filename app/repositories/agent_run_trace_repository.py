@@ -9,14 +9,23 @@ from app.db.models import AgentRunTrace
 
 
 class AgentRunTraceRepository:
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, flush_every: int = 1) -> None:
         self._session = session
+        self._flush_every = max(1, flush_every)
+        self._unflushed = 0
 
     async def create(self, trace: AgentRunTrace) -> AgentRunTrace:
+        # Unflushed traces stay in the session and go out with the next flush or commit.
         self._session.add(trace)
-        await self._session.flush()
+        self._unflushed += 1
+        if self._unflushed >= self._flush_every:
+            await self.flush()
         return trace
 
+    async def flush(self) -> None:
+        self._unflushed = 0
+        await self._session.flush()
+
     async def quality_snapshot(self, days: int = 7, user_id: int | None = None) -> dict[str, float]:
         since = datetime.now(tz=UTC) - timedelta(days=max(1, days))
         stmt = select(AgentRunTrace).where(AgentRunTrace.created_at >= since)
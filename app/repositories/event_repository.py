@@ -18,6 +18,11 @@ class EventRepository:
         await self._session.flush()
         return event
 
+    async def create_many(self, events: list[Event]) -> list[Event]:
+        self._session.add_all(events)
+        await self._session.flush()
+        return events
+
     async def get_for_user(self, user_id: int, event_id: UUID) -> Event | None:
         stmt = select(Event).where(Event.id == event_id, Event.user_id == user_id)
         result = await self._session.execute(stmt)
@@ -6,6 +6,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import User
 
+_DEFAULT_TIMEZONES = {"ru": "Europe/Moscow", "kk": "Asia/Almaty"}
+
 
 class UserRepository:
     def __init__(self, session: AsyncSession) -> None:
@@ -95,8 +97,4 @@ class UserRepository:
             return "UTC"
         normalized = language.strip().lower()
         primary = normalized.split("-", 1)[0].split("_", 1)[0]
-        if primary == "ru":
-            return "Europe/Moscow"
-        if primary == "kk":
-            return "Asia/Almaty"
-        return "UTC"
+        return _DEFAULT_TIMEZONES.get(primary, "UTC")
@@ -66,7 +66,7 @@ class ConversationStateService:
             logger.exception("assistant.backend_context_failed", user_id=user.id)
             backend_state = {}
         return {
-            "dialog_history": state.turns[-6:],
+            "dialog_history": list(state.turns)[-6:],
             "pending_question": state.pending_question,
             "pending_reason": state.pending_reason,
             "scenario_type": state.scenario_type,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 from zoneinfo import ZoneInfo
@@ -136,7 +137,7 @@ class PendingRescheduleService:
         if not isinstance(event_id_raw, str):
             return AssistantResponse("Неверные данные быстрого действия."), False
         try:
-            event_id = UUID(event_id_raw)
+            event_id = _parse_uuid(event_id_raw)
         except ValueError:
             return AssistantResponse("Неверные данные быстрого действия."), False
         command = UpdateScheduleCommand(
@@ -152,3 +153,9 @@ class PendingRescheduleService:
         )
         result = await self._events.update_schedule(user, command)
         return AssistantResponse(result), True
+
+
+# Quick-pick buttons for the same event are tapped repeatedly; invalid strings still raise ValueError.
+@lru_cache(maxsize=256)
+def _parse_uuid(raw: str) -> UUID:
+    return UUID(raw)
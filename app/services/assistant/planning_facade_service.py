@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from app.services.assistant.task_orchestrator_service import TaskOrchestratorService
 from app.services.parser.command_parser_service import CommandParserService
+from app.services.smart_agents.models import UserMemoryProfile
 
 
 class PlanningFacadeService:
@@ -11,8 +12,12 @@ class PlanningFacadeService:
         parser: CommandParserService,
         task_orchestrator: TaskOrchestratorService | None,
     ) -> None:
-        self._parser = parser
-        self._task_orchestrator = task_orchestrator
+        # Profile-aware calls go to the orchestrator when configured; resolved once here.
+        profile_target = task_orchestrator if task_orchestrator is not None else parser
+        self._route_profile = profile_target.route_conversation
+        self._route_plain = parser.route_conversation
+        self._risk_profile = profile_target.assess_plan_risk
+        self._risk_plain = parser.assess_plan_risk
 
     async def route_conversation(
         self,
@@ -23,29 +28,19 @@ class PlanningFacadeService:
         user_memory: object,
         context: dict[str, object] | None,
     ) -> tuple[str, list[str], str | None, str | None, str, bool]:
-        from app.services.smart_agents.models import UserMemoryProfile
-
-        if not isinstance(user_memory, UserMemoryProfile):
-            return await self._parser.route_conversation(
-                text=text,
-                locale=locale,
-                timezone=timezone,
-                user_memory=None,
-                context=context,
-            )
-        if self._task_orchestrator is not None:
-            return await self._task_orchestrator.route_conversation(
+        if isinstance(user_memory, UserMemoryProfile):
+            return await self._route_profile(
                 text=text,
                 locale=locale,
                 timezone=timezone,
                 user_memory=user_memory,
                 context=context,
             )
-        return await self._parser.route_conversation(
+        return await self._route_plain(
             text=text,
             locale=locale,
             timezone=timezone,
-            user_memory=user_memory,
+            user_memory=None,
             context=context,
         )
 
@@ -59,19 +54,8 @@ class PlanningFacadeService:
         user_memory: object,
         context: dict[str, object] | None,
     ) -> tuple[bool, str, str]:
-        from app.services.smart_agents.models import UserMemoryProfile
-
-        if not isinstance(user_memory, UserMemoryProfile):
-            return await self._parser.assess_plan_risk(
-                text=text,
-                operations=operations,
-                locale=locale,
-                timezone=timezone,
-                user_memory=None,
-                context=context,
-            )
-        if self._task_orchestrator is not None:
-            return await self._task_orchestrator.assess_plan_risk(
+        if isinstance(user_memory, UserMemoryProfile):
+            return await self._risk_profile(
                 text=text,
                 operations=operations,
                 locale=locale,
@@ -79,12 +63,11 @@ class PlanningFacadeService:
                 user_memory=user_memory,
                 context=context,
             )
-        return await self._parser.assess_plan_risk(
+        return await self._risk_plain(
             text=text,
             operations=operations,
             locale=locale,
             timezone=timezone,
-            user_memory=user_memory,
+            user_memory=None,
             context=context,
         )
-
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -17,6 +18,9 @@ class QuickActionOutcome:
     delegate_text: str | None = None
 
 
+QuickActionHandlerFn = Callable[[object, dict[str, Any]], Awaitable[QuickActionOutcome]]
+
+
 class QuickActionService:
     def __init__(
         self,
@@ -26,6 +30,12 @@ class QuickActionService:
     ) -> None:
         self._events = events
         self._pending_reschedule = pending_reschedule
+        self._handlers: dict[str, QuickActionHandlerFn] = {
+            "send_text_choice": self._send_text_choice,
+            "reschedule_pick": self._reschedule_pick,
+            "create_renewal_note": self._create_renewal_note,
+            "noop_set_price_hint": self._set_price_hint,
+        }
 
     async def handle(
         self,
@@ -34,49 +44,51 @@ class QuickActionService:
         action: str,
         payload: dict[str, Any],
     ) -> QuickActionOutcome:
-        if action == "send_text_choice":
-            text = payload.get("text")
-            if not isinstance(text, str) or not text.strip():
-                return QuickActionOutcome(
-                    response=AssistantResponse("Неверные данные выбора."),
-                )
+        handler = self._handlers.get(action)
+        if handler is None:
             return QuickActionOutcome(
-                response=AssistantResponse(""),
-                delegate_text=text,
+                response=AssistantResponse("Быстрое действие не поддерживается."),
             )
+        return await handler(user, payload)
 
-        if action == "reschedule_pick":
-            response, should_commit = await self._pending_reschedule.quick_pick(
-                user=user,
-                payload=payload,
+    async def _send_text_choice(self, user: object, payload: dict[str, Any]) -> QuickActionOutcome:
+        text = payload.get("text")
+        if not isinstance(text, str) or not text.strip():
+            return QuickActionOutcome(
+                response=AssistantResponse("Неверные данные выбора."),
             )
-            return QuickActionOutcome(response=response, should_commit=should_commit)
+        return QuickActionOutcome(
+            response=AssistantResponse(""),
+            delegate_text=text,
+        )
 
-        if action == "create_renewal_note":
-            student_name = payload.get("student_name")
-            if not isinstance(student_name, str) or not student_name.strip():
-                return QuickActionOutcome(
-                    response=AssistantResponse("Не удалось создать запрос на продление."),
-                )
-            note_cmd = CreateNoteCommand(
-                intent=Intent.CREATE_NOTE,
-                title=f"Продление предоплаты: {student_name}",
-                content=f"Связаться с учеником {student_name} для продления.",
-                tags=["billing", "renewal"],
-            )
-            result = await self._events.create_note(user, note_cmd)
-            return QuickActionOutcome(response=AssistantResponse(result), should_commit=True)
+    async def _reschedule_pick(self, user: object, payload: dict[str, Any]) -> QuickActionOutcome:
+        response, should_commit = await self._pending_reschedule.quick_pick(
+            user=user,
+            payload=payload,
+        )
+        return QuickActionOutcome(response=response, should_commit=should_commit)
 
-        if action == "noop_set_price_hint":
-            student_name = payload.get("student_name")
-            suffix = f" для {student_name}" if isinstance(student_name, str) and student_name else ""
+    async def _create_renewal_note(self, user: object, payload: dict[str, Any]) -> QuickActionOutcome:
+        student_name = payload.get("student_name")
+        if not isinstance(student_name, str) or not student_name.strip():
             return QuickActionOutcome(
-                response=AssistantResponse(
-                    f"Напишите: 'установи цену занятия{suffix} 2500' или 'измени цену{suffix} на 3000'."
-                )
+                response=AssistantResponse("Не удалось создать запрос на продление."),
             )
+        note_cmd = CreateNoteCommand(
+            intent=Intent.CREATE_NOTE,
+            title=f"Продление предоплаты: {student_name}",
+            content=f"Связаться с учеником {student_name} для продления.",
+            tags=["billing", "renewal"],
+        )
+        result = await self._events.create_note(user, note_cmd)
+        return QuickActionOutcome(response=AssistantResponse(result), should_commit=True)
 
+    async def _set_price_hint(self, user: object, payload: dict[str, Any]) -> QuickActionOutcome:
+        student_name = payload.get("student_name")
+        suffix = f" для {student_name}" if isinstance(student_name, str) and student_name else ""
         return QuickActionOutcome(
-            response=AssistantResponse("Быстрое действие не поддерживается."),
+            response=AssistantResponse(
+                f"Напишите: 'установи цену занятия{suffix} 2500' или 'измени цену{suffix} на 3000'."
+            )
         )
-
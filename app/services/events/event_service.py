@@ -13,6 +13,7 @@ from app.core.datetime_utils import (
     next_weekday_time,
     parse_date_input,
     parse_datetime_input,
+    parse_local_iso,
     start_of_local_day,
 )
 from app.db.models import Event, Note, PaymentTransaction, Student, User
@@ -44,6 +45,7 @@ from app.services.reminders.due_index_service import DueIndexService
 from app.services.reminders.occurrence_service import (
     event_next_occurrence,
     event_occurrences_between,
+    events_starting_before,
 )
 from app.services.smart_agents import ConflictDetectionAgent, ScheduleOptimizationAgent
 
@@ -333,17 +335,23 @@ class EventService:
             return "Не удалось определить переносимый урок."
 
         source_local = source_occurrence.astimezone(tz)
-        target_text: str
-        if cmd.new_date and cmd.new_time:
-            target_text = f"{cmd.new_date} {cmd.new_time}"
-        elif cmd.new_date:
-            target_text = f"{cmd.new_date} {source_local.strftime('%H:%M')}"
-        elif cmd.new_time:
-            target_text = f"{source_local.strftime('%d.%m.%Y')} {cmd.new_time}"
-        else:
+        if not cmd.new_date and not cmd.new_time:
             return "Уточните новую дату или время переноса."
 
-        new_start = parse_datetime_input(target_text, user.timezone, languages=[user.language, "ru", "en"])
+        new_start = parse_local_iso(
+            cmd.new_date or source_local.date().isoformat(),
+            cmd.new_time or source_local.strftime("%H:%M"),
+            user.timezone,
+        )
+        if new_start is None:
+            target_text: str
+            if cmd.new_date and cmd.new_time:
+                target_text = f"{cmd.new_date} {cmd.new_time}"
+            elif cmd.new_date:
+                target_text = f"{cmd.new_date} {source_local.strftime('%H:%M')}"
+            else:
+                target_text = f"{source_local.strftime('%d.%m.%Y')} {cmd.new_time}"
+            new_start = parse_datetime_input(target_text, user.timezone, languages=[user.language, "ru", "en"])
         if new_start is None:
             return "Не удалось распознать новую дату/время переноса."
         duration = (event.ends_at - event.starts_at) if event.ends_at else timedelta(minutes=60)
@@ -567,7 +575,8 @@ class EventService:
             end_utc = start_utc + timedelta(days=1)
 
         occurrences: list[tuple[datetime, Event]] = []
-        for event in events:
+        # list_for_user returns events ordered by starts_at, which events_starting_before relies on.
+        for event in events_starting_before(events, end_utc):
             if cmd.student_name:
                 student_name = str(event.extra_data.get("student_name", event.title))
                 if cmd.student_name.lower() not in student_name.lower():
@@ -608,7 +617,8 @@ class EventService:
         end_utc = local_end.astimezone(UTC)
 
         result: list[tuple[datetime, Event]] = []
-        for lesson in lessons:
+        # list_active_lessons_for_user orders by starts_at, which events_starting_before relies on.
+        for lesson in events_starting_before(lessons, end_utc):
             for occ in event_occurrences_between(lesson, start_utc, end_utc):
                 result.append((occ, lesson))
         result.sort(key=lambda x: x[0])
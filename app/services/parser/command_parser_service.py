@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import zlib
 from dataclasses import asdict
@@ -54,6 +55,7 @@ logger = structlog.get_logger(__name__)
 
 class CommandParserService:
     _MAX_DIALOG_HISTORY_ITEMS = 8
+    _MIN_SELF_CONTAINED_HELP_ANSWER_LEN = 120
     _TEMPORAL_CONTEXT_KEYS = (
         "now_utc_iso",
         "now_local_iso",
@@ -66,11 +68,16 @@ class CommandParserService:
         self,
         llm_client: LLMClient,
         trace_repository: AgentRunTraceRepository | None = None,
+        cached_llm_client: LLMClient | None = None,
     ) -> None:
         self._adapter: TypeAdapter[ParsedCommand] = TypeAdapter(ParsedCommand)
         self._trace_repository = trace_repository
+        self._compact_contexts: dict[tuple[str, str, str], dict[str, object] | None] = {}
+        # Only the intent and risk classifiers may be served from the shared response cache;
+        # free-text agents always sample fresh. Those two evict outputs that fail validation.
+        classifier_llm = cached_llm_client or llm_client
 
-        base_intent = IntentAgent(llm_client)
+        base_intent = IntentAgent(classifier_llm)
         base_command = CommandAgent(llm_client)
         base_batch_command = BatchCommandAgent(llm_client)
         base_recovery = RecoveryAgent(llm_client)
@@ -84,7 +91,7 @@ class CommandParserService:
         self._execution_supervisor = ExecutionSupervisorAgent(llm_client)
         self._task_chunker = TaskChunkingAgent(llm_client)
         self._task_graph = TaskGraphAgent(llm_client)
-        self._risk_policy = RiskPolicyAgent(llm_client)
+        self._risk_policy = RiskPolicyAgent(classifier_llm)
         self._plan_repair = PlanRepairAgent(llm_client)
         self._response_policy = ResponsePolicyAgent(llm_client)
         self._choice_options = ChoiceOptionsAgent(llm_client)
@@ -252,6 +259,16 @@ class CommandParserService:
             user_memory=user_memory,
             context=context,
         )
+        # The help agent does not depend on the primary decision, so it runs speculatively
+        # alongside it and is dropped when the primary assistant does not answer.
+        help_task = asyncio.create_task(
+            self._help_knowledge.answer(
+                text=text,
+                locale=locale,
+                timezone=timezone,
+                user_memory=agent_memory,
+            )
+        )
         try:
             decision = await self._primary_assistant.decide(
                 text=text,
@@ -261,21 +278,21 @@ class CommandParserService:
             )
         except Exception:
             logger.exception("parser.primary_assistant_failed")
+            await self._drop_task(help_task)
             return None
 
-        if decision.mode != "answer":
-            return None
-        if decision.confidence < 0.75:
+        if decision.mode != "answer" or decision.confidence < 0.75:
+            await self._drop_task(help_task)
             return None
         fallback_answer = (decision.answer or "").strip()
+        # The help request is already in flight, so a detailed primary answer saves latency, not
+        # an LLM call: the speculative task is cancelled and its answer is never shown.
+        if len(fallback_answer) >= self._MIN_SELF_CONTAINED_HELP_ANSWER_LEN:
+            await self._drop_task(help_task)
+            return fallback_answer
 
         try:
-            help_answer = await self._help_knowledge.answer(
-                text=text,
-                locale=locale,
-                timezone=timezone,
-                user_memory=agent_memory,
-            )
+            help_answer = await help_task
             resolved = (help_answer.answer or "").strip()
             if help_answer.confidence >= 0.65 and resolved:
                 return resolved
@@ -284,6 +301,11 @@ class CommandParserService:
 
         return fallback_answer or None
 
+    @staticmethod
+    async def _drop_task(task: asyncio.Task[object]) -> None:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
     async def route_conversation(
         self,
         text: str,
@@ -602,9 +624,40 @@ class CommandParserService:
                 merged["latest_user_text"] = latest_user_text
             merged.update(temporal_context)
             return merged
+        # One request routes, chunks, plans and supervises over the same context;
+        # the summary is computed once and reused by every later stage.
+        cache_key = (locale, timezone, serialized)
+        if cache_key in self._compact_contexts:
+            compact_context = self._compact_contexts[cache_key]
+        else:
+            compact_context = await self._compress_context(
+                normalized_context,
+                locale=locale,
+                timezone=timezone,
+                user_memory=user_memory,
+            )
+            self._compact_contexts[cache_key] = compact_context
+        if compact_context is None:
+            return merged
+        result = dict(merged)
+        result["context_compact"] = compact_context
+        result.pop("context", None)
+        if latest_user_text is not None:
+            result["latest_user_text"] = latest_user_text
+        result.update(temporal_context)
+        return result
+
+    async def _compress_context(
+        self,
+        context: dict[str, object],
+        *,
+        locale: str,
+        timezone: str,
+        user_memory: UserMemoryProfile | None,
+    ) -> dict[str, object] | None:
         context_for_compression = {
             key: value
-            for key, value in normalized_context.items()
+            for key, value in context.items()
             if key != "latest_user_text"
         }
         try:
@@ -616,21 +669,14 @@ class CommandParserService:
             )
         except Exception:
             logger.exception("parser.context_compressor_failed")
-            return merged
+            return None
         if compressed.confidence < 0.6:
-            return merged
-        compact_context = {
+            return None
+        return {
             "summary": compressed.summary,
             "facts": compressed.facts,
             "original_keys": sorted(context_for_compression.keys()),
         }
-        result = dict(merged)
-        result["context_compact"] = compact_context
-        result.pop("context", None)
-        if latest_user_text is not None:
-            result["latest_user_text"] = latest_user_text
-        result.update(temporal_context)
-        return result
 
     def _normalize_context(self, context: dict[str, object] | None) -> dict[str, object] | None:
         if context is None:
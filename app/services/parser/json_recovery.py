@@ -1,27 +1,35 @@
 from __future__ import annotations
 
 import ast
-import json
 import re
 from typing import Any
 
+import orjson
+
+_FENCE_OPEN_RE = re.compile(r"^```(?:json)?", re.IGNORECASE)
+_FENCE_CLOSE_RE = re.compile(r"```$")
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
 
 def recover_json_object(raw: str) -> dict[str, Any]:
     cleaned = raw.strip()
-    cleaned = re.sub(r"^```(?:json)?", "", cleaned, flags=re.IGNORECASE).strip()
-    cleaned = re.sub(r"```$", "", cleaned).strip()
+    cleaned = _FENCE_OPEN_RE.sub("", cleaned).strip()
+    cleaned = _FENCE_CLOSE_RE.sub("", cleaned).strip()
 
-    match = re.search(r"\{.*\}", cleaned, flags=re.DOTALL)
-    if match:
-        cleaned = match.group(0)
+    match = _JSON_OBJECT_RE.search(cleaned)
+    if match is None:
+        # Without a brace pair neither json nor literal_eval can produce an object.
+        msg = "Expected JSON object"
+        raise ValueError(msg)
+    cleaned = match.group(0)
 
     try:
-        loaded = json.loads(cleaned)
+        loaded = orjson.loads(cleaned)
         if not isinstance(loaded, dict):
             msg = "Expected JSON object"
             raise ValueError(msg)
         return loaded
-    except json.JSONDecodeError as err:
+    except orjson.JSONDecodeError as err:
         literal = ast.literal_eval(cleaned)
         if not isinstance(literal, dict):
             msg = "Expected object from recovery"
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections.abc import Sequence
 from datetime import datetime
+from functools import lru_cache
 
-from dateutil.rrule import rrulestr
+from dateutil.rrule import rrule, rruleset, rrulestr
 
 from app.core.datetime_utils import ensure_utc
 from app.db.models import Event
@@ -23,7 +26,7 @@ def event_occurrences_between(event: Event, start_utc: datetime, end_utc: dateti
         return []
 
     try:
-        rule = rrulestr(event.rrule, dtstart=event_start)
+        rule = _build_rrule(event.rrule, event_start)
     except Exception:
         return []
 
@@ -32,6 +35,13 @@ def event_occurrences_between(event: Event, start_utc: datetime, end_utc: dateti
     return [item for item in normalized if not _is_excluded(event, item)]
 
 
+def events_starting_before(events: Sequence[Event], end_utc: datetime) -> Sequence[Event]:
+    """Drop events starting after end_utc; events must be sorted by starts_at or some are lost."""
+    # Keeps starts_at == end_utc: rule.between(..., inc=True) still yields that first occurrence.
+    cutoff = bisect_right(events, ensure_utc(end_utc), key=lambda event: ensure_utc(event.starts_at))
+    return events[:cutoff]
+
+
 def event_next_occurrence(event: Event, after_utc: datetime) -> datetime | None:
     after = ensure_utc(after_utc)
     event_start = ensure_utc(event.starts_at)
@@ -44,7 +54,7 @@ def event_next_occurrence(event: Event, after_utc: datetime) -> datetime | None:
         return None
 
     try:
-        rule = rrulestr(event.rrule, dtstart=event_start)
+        rule = _build_rrule(event.rrule, event_start)
         next_dt = rule.after(after, inc=True)
     except Exception:
         return None
@@ -65,6 +75,12 @@ def event_next_occurrence(event: Event, after_utc: datetime) -> datetime | None:
     return normalized
 
 
+# Parsed rules are only queried through between()/after(), so sharing them across events is safe.
+@lru_cache(maxsize=4096)
+def _build_rrule(rrule_text: str, dtstart: datetime) -> rrule | rruleset:
+    return rrulestr(rrule_text, dtstart=dtstart)
+
+
 def _is_excluded(event: Event, occurrence: datetime) -> bool:
     raw = event.extra_data.get("excluded_occurrences", [])
     if not isinstance(raw, list):
@@ -349,8 +349,8 @@ class UserMemoryAgent:
         return UserMemoryProfile(
             timezone=user.timezone,
             locale=user.language,
-            default_offsets=offsets,
-            work_days=user.work_days,
+            default_offsets=tuple(offsets),
+            work_days=tuple(user.work_days or ()),
             time_format_24h=True,
         )
 
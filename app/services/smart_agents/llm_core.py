@@ -4,6 +4,7 @@ from time import perf_counter
 from typing import Any
 
 import structlog
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 from app.domain.enums import Intent
 from app.integrations.llm.base import LLMClient
@@ -52,6 +53,17 @@ from app.services.smart_agents.prompts import (
 logger = structlog.get_logger(__name__)
 
 _AGENT_IO_LOG_CHARS = 1200  # max chars to log from prompt tail and response head
+_MIN_CACHEABLE_RISK_CONFIDENCE = 0.6  # the orchestrator ignores risk decisions below this
+
+
+class _AgentEnvelope(BaseModel):
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+    result: Any
+    confidence: float = 0.75
+    needs_clarification: bool = False
+    clarify_question: str | None = None
+    reasons: list[str] = Field(default_factory=list)
 
 
 def _truncate_tail(text: str, max_chars: int) -> str:
@@ -93,6 +105,22 @@ class BaseLLMAgent:
         return response
 
     def _parse_output(self, raw: str) -> AgentOutput:
+        # Well-formed envelopes are decoded and validated in one pass; fenced, single-quoted
+        # or legacy direct-json outputs fall through to the recovering parser below.
+        try:
+            envelope = _AgentEnvelope.model_validate_json(raw)
+        except ValidationError:
+            return self._parse_recovered_output(raw)
+        result = envelope.result
+        return AgentOutput(
+            result=result if isinstance(result, dict) else {"value": result},
+            confidence=envelope.confidence,
+            needs_clarification=envelope.needs_clarification,
+            clarify_question=envelope.clarify_question,
+            reasons=envelope.reasons,
+        )
+
+    def _parse_recovered_output(self, raw: str) -> AgentOutput:
         loaded = recover_json_object(raw)
         if "result" in loaded:
             result = loaded.get("result")
@@ -130,10 +158,8 @@ class IntentAgent(BaseLLMAgent):
         timezone: str,
         user_memory: dict[str, Any] | None = None,
     ) -> IntentDecision:
-        raw = await self._complete(
-            build_intent_prompt(text=text, locale=locale, timezone=timezone, user_memory=user_memory),
-            stage="intent",
-        )
+        prompt = build_intent_prompt(text=text, locale=locale, timezone=timezone, user_memory=user_memory)
+        raw = await self._complete(prompt, stage="intent")
         parsed = self._parse_output(raw)
 
         decision = IntentDecision(
@@ -142,6 +168,9 @@ class IntentAgent(BaseLLMAgent):
             question=parsed.clarify_question,
         )
         normalized = decision.normalized_intent()
+        # Only outputs that parsed and validated may be replayed from the response cache.
+        if normalized == decision.intent:
+            self._llm_client.remember(prompt, raw)
         if normalized == Intent.CLARIFY.value:
             decision.intent = Intent.CLARIFY.value
             decision.needs_clarification = True
@@ -486,8 +515,11 @@ class RiskPolicyAgent(BaseLLMAgent):
             timezone=timezone,
             user_memory=user_memory,
         )
-        parsed = self._parse_output(await self._complete(prompt, stage="risk_policy"))
+        raw = await self._complete(prompt, stage="risk_policy")
+        parsed = self._parse_output(raw)
         risk_raw = str(parsed.result.get("risk_level", "low")).lower()
+        if risk_raw in {"low", "medium", "high"} and parsed.confidence >= _MIN_CACHEABLE_RISK_CONFIDENCE:
+            self._llm_client.remember(prompt, raw)
         risk_level = risk_raw if risk_raw in {"low", "medium", "high"} else "low"
         summary = str(parsed.result.get("summary")) if parsed.result.get("summary") is not None else None
         return RiskPolicyDecision(
@@ -92,12 +92,12 @@ class FollowUpQuestion:
     confidence: float
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class UserMemoryProfile:
     timezone: str
     locale: str
-    default_offsets: list[int]
-    work_days: list[int]
+    default_offsets: tuple[int, ...]
+    work_days: tuple[int, ...]
     time_format_24h: bool
 
 
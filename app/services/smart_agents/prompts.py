@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from typing import Any
 
 __all__ = [
@@ -61,12 +62,8 @@ def _help_capabilities_block() -> str:
     )
 
 
-def build_intent_prompt(
-    text: str,
-    locale: str,
-    timezone: str,
-    user_memory: dict[str, Any] | None = None,
-) -> str:
+@lru_cache(maxsize=256)
+def _intent_instructions(locale: str, timezone: str) -> str:
     return (
         f"{_contract_header()} "
         "Классифицируй намерение пользователя. "
@@ -104,6 +101,17 @@ def build_intent_prompt(
         "26) 'поставь часовой пояс Москва' / 'часовой пояс Europe/Moscow' / 'хочу московское время' -> update_settings(timezone).\n"
         "27) Не проси уточнение для относительных дат ('сегодня/завтра/послезавтра'), если запрос содержит время.\n"
         f"Локаль: {locale}. Таймзона: {timezone}."
+    )
+
+
+def build_intent_prompt(
+    text: str,
+    locale: str,
+    timezone: str,
+    user_memory: dict[str, Any] | None = None,
+) -> str:
+    return (
+        f"{_intent_instructions(locale, timezone)}"
         f"{_memory_block(user_memory)}\n"
         f"Текст пользователя: {text}"
     )
@@ -239,12 +247,8 @@ def build_recurrence_prompt(
     )
 
 
-def build_primary_assistant_prompt(
-    text: str,
-    locale: str,
-    timezone: str,
-    user_memory: dict[str, Any] | None = None,
-) -> str:
+@lru_cache(maxsize=256)
+def _primary_assistant_instructions(locale: str, timezone: str) -> str:
     return (
         f"{_contract_header()} "
         "Ты главный assistant-агент TimeKeeper. "
@@ -257,17 +261,24 @@ def build_primary_assistant_prompt(
         "2) Если пользователь просит выполнить действие (создать/изменить/удалить/показать данные) -> mode=delegate.\n"
         "3) Не выдумывай действия сам, для операций всегда delegate.\n"
         f"Локаль: {locale}. Таймзона: {timezone}."
-        f"{_memory_block(user_memory)}\n"
-        f"Текст пользователя: {text}"
     )
 
 
-def build_help_knowledge_prompt(
+def build_primary_assistant_prompt(
     text: str,
     locale: str,
     timezone: str,
     user_memory: dict[str, Any] | None = None,
 ) -> str:
+    return (
+        f"{_primary_assistant_instructions(locale, timezone)}"
+        f"{_memory_block(user_memory)}\n"
+        f"Текст пользователя: {text}"
+    )
+
+
+@lru_cache(maxsize=256)
+def _help_knowledge_instructions(locale: str, timezone: str) -> str:
     return (
         f"{_contract_header()} "
         "Ты HelpKnowledgeAgent для TimeKeeper. "
@@ -276,6 +287,17 @@ def build_help_knowledge_prompt(
         'Верни result формата: {"answer":"строка"}.\n'
         f"{_help_capabilities_block()}\n"
         f"Локаль: {locale}. Таймзона: {timezone}."
+    )
+
+
+def build_help_knowledge_prompt(
+    text: str,
+    locale: str,
+    timezone: str,
+    user_memory: dict[str, Any] | None = None,
+) -> str:
+    return (
+        f"{_help_knowledge_instructions(locale, timezone)}"
         f"{_memory_block(user_memory)}\n"
         f"Вопрос пользователя: {text}"
     )
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import json
 from uuid import UUID, uuid4
 
+import orjson
 from redis.asyncio import Redis
 
 from app.services.assistant.assistant_response import AmbiguityOption, AmbiguityRequest
@@ -22,14 +22,14 @@ class AmbiguityStore:
             "command_payload": request.command_payload,
             "options": [
                 {
-                    "event_id": str(item.event_id),
+                    "event_id": item.event_id,
                     "title": item.title,
                     "subtitle": item.subtitle,
                 }
                 for item in request.options
             ],
         }
-        await self._redis.set(key, json.dumps(payload, ensure_ascii=False), ex=self._ttl)
+        await self._redis.set(key, orjson.dumps(payload), ex=self._ttl)
         return token
 
     async def get(self, token: str) -> tuple[int, AmbiguityRequest] | None:
@@ -38,15 +38,15 @@ class AmbiguityStore:
         if raw is None:
             return None
 
-        payload = json.loads(raw.decode("utf-8") if isinstance(raw, bytes) else str(raw))
+        payload = orjson.loads(raw)
         request = AmbiguityRequest(
-            action=str(payload["action"]),
+            action=payload["action"],
             command_payload=dict(payload["command_payload"]),
             options=[
                 AmbiguityOption(
-                    event_id=UUID(str(item["event_id"])),
-                    title=str(item["title"]),
-                    subtitle=str(item["subtitle"]),
+                    event_id=UUID(item["event_id"]),
+                    title=item["title"],
+                    subtitle=item["subtitle"],
                 )
                 for item in payload["options"]
             ],
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import json
 from uuid import UUID, uuid4
 
+import orjson
 from redis.asyncio import Redis
 
 from app.services.assistant.assistant_response import ConfirmationRequest
@@ -20,22 +20,22 @@ class ConfirmationStore:
             "telegram_id": telegram_id,
             "action": request.action,
             "command_payload": request.command_payload,
-            "event_id": str(request.event_id) if request.event_id is not None else None,
+            "event_id": request.event_id,
             "summary": request.summary,
         }
-        await self._redis.set(key, json.dumps(payload, ensure_ascii=False), ex=self._ttl)
+        await self._redis.set(key, orjson.dumps(payload), ex=self._ttl)
         return token
 
     async def get(self, token: str) -> tuple[int, ConfirmationRequest] | None:
         raw = await self._redis.get(self._key(token))
         if raw is None:
             return None
-        payload = json.loads(raw.decode("utf-8") if isinstance(raw, bytes) else str(raw))
+        payload = orjson.loads(raw)
         request = ConfirmationRequest(
-            action=str(payload["action"]),
+            action=payload["action"],
             command_payload=dict(payload["command_payload"]),
-            event_id=(UUID(str(payload["event_id"])) if payload.get("event_id") is not None else None),
-            summary=str(payload.get("summary", "")),
+            event_id=(UUID(payload["event_id"]) if payload.get("event_id") is not None else None),
+            summary=payload.get("summary", ""),
         )
         return int(payload["telegram_id"]), request
 
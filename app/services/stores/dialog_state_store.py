@@ -1,35 +1,92 @@
 from __future__ import annotations
 
-import json
+from collections import deque
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from typing import Any
 
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from redis.asyncio import Redis
 
+DEFAULT_MAX_TURNS = 8
+
+
+def _empty_turns() -> deque[dict[str, str]]:
+    return deque(maxlen=DEFAULT_MAX_TURNS)
+
 
 @dataclass(slots=True)
 class DialogState:
-    turns: list[dict[str, str]] = field(default_factory=list)
+    # Bounded at append time, so neither encode nor decode has to slice the history.
+    turns: deque[dict[str, str]] = field(default_factory=_empty_turns)
     pending_question: str | None = None
     pending_reason: str | None = None
     scenario_type: str | None = None
     scenario_payload: dict[str, object] = field(default_factory=dict)
     scenario_expires_at: str | None = None
+    _expiry_source: str | None = field(default=None, init=False, repr=False, compare=False)
+    _expiry: datetime | None = field(default=None, init=False, repr=False, compare=False)
 
     def has_active_scenario(self, now_utc: datetime | None = None) -> bool:
         if not self.scenario_type:
             return False
         if not self.scenario_expires_at:
             return True
-        now = now_utc or datetime.now(tz=UTC)
-        try:
-            return now <= datetime.fromisoformat(self.scenario_expires_at)
-        except ValueError:
+        expires_at = self._parsed_expiry()
+        if expires_at is None:
             return False
+        return (now_utc or datetime.now(tz=UTC)) <= expires_at
+
+    def _parsed_expiry(self) -> datetime | None:
+        # The ISO string stays the source of truth (it is shown to the LLM); parse it once per value.
+        if self._expiry_source is not self.scenario_expires_at:
+            self._expiry_source = self.scenario_expires_at
+            try:
+                self._expiry = datetime.fromisoformat(self.scenario_expires_at or "")
+            except ValueError:
+                self._expiry = None
+        return self._expiry
+
+
+class _TurnWire(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True, coerce_numbers_to_str=True)
+
+    role: str = "user"
+    content: str = ""
+
+
+class _DialogWire(BaseModel):
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+    # Turns and the scenario payload are checked item by item in decode(), so one bad
+    # entry is dropped instead of failing the whole blob.
+    turns: list[Any] = Field(default_factory=list)
+    pending_question: str | None = None
+    pending_reason: str | None = None
+    scenario_type: str | None = None
+    scenario_payload: Any = None
+    scenario_expires_at: str | None = None
+
+
+def _valid_turns(items: list[Any]) -> Iterator[dict[str, str]]:
+    for item in items:
+        try:
+            turn = _TurnWire.model_validate(item)
+        except ValidationError:
+            continue
+        if turn.content:
+            yield {"role": turn.role, "content": turn.content}
 
 
 class DialogStateStore:
-    def __init__(self, redis: Redis, ttl_seconds: int = 86400, max_turns: int = 8) -> None:
+    def __init__(
+        self,
+        redis: Redis,
+        ttl_seconds: int = 86400,
+        max_turns: int = DEFAULT_MAX_TURNS,
+    ) -> None:
         self._redis = redis
         self._ttl = ttl_seconds
         self._max_turns = max_turns
@@ -38,43 +95,35 @@ class DialogStateStore:
         raw = await self._redis.get(self._key(telegram_id))
         if raw is None:
             return DialogState()
-        payload = json.loads(raw.decode("utf-8") if isinstance(raw, bytes) else str(raw))
-        turns_raw = payload.get("turns", [])
-        turns: list[dict[str, str]] = []
-        if isinstance(turns_raw, list):
-            for item in turns_raw[-self._max_turns :]:
-                if isinstance(item, dict):
-                    role = str(item.get("role", "user"))
-                    content = str(item.get("content", "")).strip()
-                    if content:
-                        turns.append({"role": role, "content": content})
-        pending_question = payload.get("pending_question")
-        pending_reason = payload.get("pending_reason")
-        scenario_type = payload.get("scenario_type")
-        scenario_payload_raw = payload.get("scenario_payload")
-        scenario_payload: dict[str, object] = {}
-        if isinstance(scenario_payload_raw, dict):
-            scenario_payload = scenario_payload_raw
-        scenario_expires_at = payload.get("scenario_expires_at")
+        return self.decode(raw)
+
+    def decode(self, raw: bytes | str) -> DialogState:
+        wire = _DialogWire.model_validate_json(raw)
         return DialogState(
-            turns=turns,
-            pending_question=(str(pending_question) if pending_question else None),
-            pending_reason=(str(pending_reason) if pending_reason else None),
-            scenario_type=(str(scenario_type) if scenario_type else None),
-            scenario_payload=scenario_payload,
-            scenario_expires_at=(str(scenario_expires_at) if scenario_expires_at else None),
+            turns=deque(_valid_turns(wire.turns), maxlen=self._max_turns),
+            pending_question=wire.pending_question or None,
+            pending_reason=wire.pending_reason or None,
+            scenario_type=wire.scenario_type or None,
+            scenario_payload=wire.scenario_payload if isinstance(wire.scenario_payload, dict) else {},
+            scenario_expires_at=wire.scenario_expires_at or None,
         )
 
     async def save(self, telegram_id: int, state: DialogState) -> None:
+        await self._redis.set(self._key(telegram_id), self._encode(state), ex=self._ttl)
+
+    def _encode(self, state: DialogState) -> bytes:
+        turns = list(state.turns)
+        if len(turns) > self._max_turns:
+            del turns[: -self._max_turns]
         payload = {
-            "turns": state.turns[-self._max_turns :],
+            "turns": turns,
             "pending_question": state.pending_question,
             "pending_reason": state.pending_reason,
             "scenario_type": state.scenario_type,
             "scenario_payload": state.scenario_payload,
             "scenario_expires_at": state.scenario_expires_at,
         }
-        await self._redis.set(self._key(telegram_id), json.dumps(payload, ensure_ascii=False), ex=self._ttl)
+        return orjson.dumps(payload)
 
     async def clear(self, telegram_id: int) -> None:
         await self._redis.delete(self._key(telegram_id))
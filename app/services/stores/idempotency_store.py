@@ -10,8 +10,12 @@ class IdempotencyStore:
 
     async def register_once(self, key: str) -> bool:
         # True means first-seen key, False means duplicate.
-        result = await self._redis.set(self._key(key), "1", ex=self._ttl, nx=True)
+        result = await self._redis.set(self.key(key), "1", ex=self._ttl, nx=True)
         return bool(result)
 
-    def _key(self, key: str) -> str:
+    @property
+    def ttl_seconds(self) -> int:
+        return self._ttl
+
+    def key(self, key: str) -> str:
         return f"idem:{key}"
@@ -1,11 +1,15 @@
 ﻿from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from uuid import UUID
 
+import orjson
 from redis.asyncio import Redis
 
+# Binary layout: tag byte, 16 raw UUID bytes, UTF-8 action name. JSON blobs never start with the tag.
+_BINARY_TAG = b"\x01"
+_UUID_END = 1 + 16
+
 
 @dataclass(slots=True)
 class PendingAction:
@@ -19,21 +23,29 @@ class PendingActionStore:
         self._ttl = ttl_seconds
 
     async def put(self, telegram_id: int, action: PendingAction) -> None:
-        payload = {
-            "action": action.action,
-            "event_id": str(action.event_id),
-        }
-        await self._redis.set(self._key(telegram_id), json.dumps(payload, ensure_ascii=False), ex=self._ttl)
+        await self._redis.set(self.key(telegram_id), self._encode(action), ex=self._ttl)
+
+    def _encode(self, action: PendingAction) -> bytes:
+        return _BINARY_TAG + action.event_id.bytes + action.action.encode("utf-8")
 
     async def get(self, telegram_id: int) -> PendingAction | None:
-        raw = await self._redis.get(self._key(telegram_id))
+        raw = await self._redis.get(self.key(telegram_id))
         if raw is None:
             return None
-        payload = json.loads(raw.decode("utf-8") if isinstance(raw, bytes) else str(raw))
-        return PendingAction(action=str(payload["action"]), event_id=UUID(str(payload["event_id"])))
+        return self.decode(raw)
+
+    def decode(self, raw: bytes | str) -> PendingAction:
+        if isinstance(raw, bytes) and raw[:1] == _BINARY_TAG:
+            return PendingAction(
+                action=raw[_UUID_END:].decode("utf-8"),
+                event_id=UUID(bytes=raw[1:_UUID_END]),
+            )
+        # Legacy JSON payloads written before the binary layout.
+        payload = orjson.loads(raw)
+        return PendingAction(action=payload["action"], event_id=UUID(payload["event_id"]))
 
     async def clear(self, telegram_id: int) -> None:
-        await self._redis.delete(self._key(telegram_id))
+        await self._redis.delete(self.key(telegram_id))
 
-    def _key(self, telegram_id: int) -> str:
+    def key(self, telegram_id: int) -> str:
         return f"pending_action:{telegram_id}"
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import json
 from uuid import uuid4
 
+import orjson
 from redis.asyncio import Redis
 
 from app.services.assistant.assistant_response import QuickAction
@@ -26,18 +26,18 @@ class QuickActionStore:
                 for item in actions
             ],
         }
-        await self._redis.set(self._key(token), json.dumps(payload, ensure_ascii=False), ex=self._ttl)
+        await self._redis.set(self._key(token), orjson.dumps(payload), ex=self._ttl)
         return token
 
     async def get(self, token: str) -> tuple[int, list[QuickAction]] | None:
         raw = await self._redis.get(self._key(token))
         if raw is None:
             return None
-        payload = json.loads(raw.decode("utf-8") if isinstance(raw, bytes) else str(raw))
+        payload = orjson.loads(raw)
         actions = [
             QuickAction(
-                label=str(item["label"]),
-                action=str(item["action"]),
+                label=item["label"],
+                action=item["action"],
                 payload=dict(item.get("payload") or {}),
             )
             for item in payload.get("actions", [])
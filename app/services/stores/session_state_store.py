@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import structlog
+from redis.asyncio import Redis
+
+from app.services.stores.idempotency_store import IdempotencyStore
+from app.services.stores.pending_action_store import PendingAction, PendingActionStore
+
+logger = structlog.get_logger(__name__)
+
+
+class SessionStateStore:
+    def __init__(
+        self,
+        redis: Redis,
+        *,
+        pending_store: PendingActionStore | None = None,
+        idempotency_store: IdempotencyStore | None = None,
+    ) -> None:
+        self._redis = redis
+        self._pending = pending_store or PendingActionStore(redis)
+        self._idempotency = idempotency_store or IdempotencyStore(redis)
+
+    async def claim_and_load_pending(
+        self,
+        idem_key: str,
+        telegram_id: int,
+    ) -> tuple[bool, PendingAction | None]:
+        # False means the idempotency key was already claimed and the update is a duplicate.
+        # The dialog blob is left to ConversationStateService, which reads it once per message.
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.set(self._idempotency.key(idem_key), "1", ex=self._idempotency.ttl_seconds, nx=True)
+        pipe.get(self._pending.key(telegram_id))
+        claimed, pending_raw = await pipe.execute()
+        if not claimed:
+            return False, None
+        if not pending_raw:
+            return True, None
+        # The key is already claimed, so a bad blob must not abort the update.
+        try:
+            return True, self._pending.decode(pending_raw)
+        except (ValueError, KeyError, TypeError):
+            logger.warning("session_state.pending_decode_failed", telegram_id=telegram_id)
+            return True, None
@@ -1,15 +1,52 @@
 ﻿from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+import asyncio
+import os
+import sys
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Any
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import pytest_asyncio
+from redis.asyncio import ConnectionPool, Redis
+from sqlalchemy import Connection, event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.pool import StaticPool
 
 from app.db.base import Base
+from app.db.models import User
+from app.integrations.llm.base import LLMClient
 
+# Real-Redis tests FLUSHDB between runs, so they use their own URL pointing at a dedicated DB index.
+_TEST_REDIS_URL = os.environ.get("TEST_REDIS_URL")
 
-class FakeLLM:
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if _TEST_REDIS_URL:
+        return
+    skip_redis = pytest.mark.skip(reason="TEST_REDIS_URL is not set")
+    for item in items:
+        if item.get_closest_marker("redis") is not None:
+            item.add_marker(skip_redis)
+
+
+def pytest_asyncio_loop_factories(
+    config: pytest.Config,
+    item: pytest.Item,
+) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    if sys.platform == "win32":
+        return {"asyncio": asyncio.new_event_loop}
+    import uvloop
+
+    return {"uvloop": uvloop.new_event_loop}
+
+
+class FakeLLM(LLMClient):
     def __init__(self, content: str) -> None:
         self.content = content
 
@@ -25,18 +62,20 @@ class FakeSTT:
         return self.text
 
 
+_MISSING = object()
+
+
 class FakeRedis:
     def __init__(self) -> None:
         self._store: dict[str, object] = {}
 
     async def incr(self, key: str) -> int:
         current = self._store.get(key, 0)
-        value = (int(current) if isinstance(current, int) else 0) + 1
-        self._store[key] = value
+        value = self._store[key] = (current if isinstance(current, int) else 0) + 1
         return value
 
     async def expire(self, key: str, seconds: int) -> bool:
-        return True
+        return key in self._store
 
     async def set(self, key: str, value: str, ex: int, nx: bool = False) -> bool:
         if nx and key in self._store:
@@ -48,14 +87,34 @@ class FakeRedis:
         return self._store.get(key)
 
     async def delete(self, key: str) -> int:
-        if key in self._store:
-            del self._store[key]
-            return 1
-        return 0
+        return 0 if self._store.pop(key, _MISSING) is _MISSING else 1
 
     async def ping(self) -> bool:
         return True
 
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    # Queues commands and replays them against FakeRedis on execute(), like redis-py's pipeline.
+    def __init__(self, redis: FakeRedis) -> None:
+        self._redis = redis
+        self._commands: list[Callable[[], Awaitable[object]]] = []
+
+    def set(self, key: str, value: str, ex: int, nx: bool = False) -> None:
+        self._commands.append(lambda: self._redis.set(key, value, ex=ex, nx=nx))
+
+    def get(self, key: str) -> None:
+        self._commands.append(lambda: self._redis.get(key))
+
+    def delete(self, key: str) -> None:
+        self._commands.append(lambda: self._redis.delete(key))
+
+    async def execute(self) -> list[object]:
+        commands, self._commands = self._commands, []
+        return [await command() for command in commands]
+
 
 class FakeNotifier:
     def __init__(self) -> None:
@@ -73,21 +132,45 @@ class FakeNotifier:
         return None
 
 
-@pytest.fixture
-async def session_factory() -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def db_engine() -> AsyncGenerator[AsyncEngine, None]:
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+
+    # pysqlite emits BEGIN lazily and would let the outermost SAVEPOINT commit;
+    # take over transaction control so per-test rollback really discards writes.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection: Any, connection_record: Any) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn: Connection) -> None:
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-
-    factory = async_sessionmaker(engine, expire_on_commit=False)
-    yield factory
+    yield engine
     await engine.dispose()
 
 
+@pytest.fixture
+async def session_factory(
+    db_engine: AsyncEngine,
+) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    async with db_engine.connect() as conn:
+        transaction = await conn.begin()
+        factory = async_sessionmaker(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        yield factory
+        await transaction.rollback()
+
+
 @pytest.fixture
 async def db_session(
     session_factory: async_sessionmaker[AsyncSession],
@@ -96,6 +179,12 @@ async def db_session(
         yield session
 
 
+# Transient and never attached to a session; tests must not mutate it.
+@pytest.fixture(scope="session")
+def ru_user() -> User:
+    return User(telegram_id=1, language="ru", timezone="Europe/Moscow")
+
+
 @pytest.fixture
 def fake_redis() -> FakeRedis:
     return FakeRedis()
@@ -104,3 +193,19 @@ def fake_redis() -> FakeRedis:
 @pytest.fixture
 def fake_notifier() -> FakeNotifier:
     return FakeNotifier()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def real_redis_pool() -> AsyncGenerator[ConnectionPool, None]:
+    assert _TEST_REDIS_URL is not None
+    pool = ConnectionPool.from_url(_TEST_REDIS_URL, max_connections=16)
+    yield pool
+    await pool.disconnect()
+
+
+@pytest.fixture
+async def redis_client(real_redis_pool: ConnectionPool) -> AsyncGenerator[Redis, None]:
+    client = Redis(connection_pool=real_redis_pool)
+    await client.flushdb()
+    yield client
+    await client.aclose()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import AsyncGenerator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -14,12 +15,13 @@ from app.core.config import Settings
 from app.core.container import AppContainer
 from app.db.models import AgentRunTrace, Event
 from app.domain.enums import EventType
+from app.integrations.llm.base import LLMClient
 from app.repositories.agent_run_trace_repository import AgentRunTraceRepository
 from app.repositories.event_repository import EventRepository
 from app.repositories.user_repository import UserRepository
 
 
-class DummyLLM:
+class DummyLLM(LLMClient):
     async def complete(self, prompt: str) -> str:
         return "{}"
 
@@ -42,55 +44,49 @@ class DummyNotifier:
         return None
 
 
-@pytest.mark.asyncio
-async def test_health_live_endpoint(
+@pytest.fixture(scope="module")
+def api_settings(tmp_path_factory: pytest.TempPathFactory) -> Settings:
+    return Settings(TELEGRAM_BOT_TOKEN="test", EXPORT_DIR=tmp_path_factory.mktemp("exports"))
+
+
+@pytest.fixture(scope="module")
+def api_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+@pytest.fixture
+async def api_client(
+    api_app: FastAPI,
+    api_settings: Settings,
     session_factory: async_sessionmaker[AsyncSession],
     fake_redis: Any,
-    tmp_path: Path,
-) -> None:
-    settings = Settings(TELEGRAM_BOT_TOKEN="test", EXPORT_DIR=tmp_path)
-    container = AppContainer(
-        settings=settings,
+) -> AsyncGenerator[AsyncClient, None]:
+    # The app and its routes are built once per module; only the per-test DB and Redis are swapped.
+    api_app.state.container = AppContainer(
+        settings=api_settings,
         session_factory=session_factory,
         redis=fake_redis,
         llm_client=DummyLLM(),
         stt_client=DummySTT(),
         notifier=DummyNotifier(),
     )
+    async with AsyncClient(transport=ASGITransport(app=api_app), base_url="http://test") as client:
+        yield client
 
-    app = FastAPI()
-    app.include_router(router)
-    app.state.container = container
 
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        response = await client.get("/health/live")
+@pytest.mark.asyncio
+async def test_health_live_endpoint(api_client: AsyncClient) -> None:
+    response = await api_client.get("/health/live")
 
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
 
 
 @pytest.mark.asyncio
-async def test_health_ready_endpoint(
-    session_factory: async_sessionmaker[AsyncSession],
-    fake_redis: Any,
-    tmp_path: Path,
-) -> None:
-    settings = Settings(TELEGRAM_BOT_TOKEN="test", EXPORT_DIR=tmp_path)
-    container = AppContainer(
-        settings=settings,
-        session_factory=session_factory,
-        redis=fake_redis,
-        llm_client=DummyLLM(),
-        stt_client=DummySTT(),
-        notifier=DummyNotifier(),
-    )
-
-    app = FastAPI()
-    app.include_router(router)
-    app.state.container = container
-
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        response = await client.get("/health/ready")
+async def test_health_ready_endpoint(api_client: AsyncClient) -> None:
+    response = await api_client.get("/health/ready")
 
     assert response.status_code == 200
     assert response.json() == {"status": "ready"}
@@ -98,20 +94,9 @@ async def test_health_ready_endpoint(
 
 @pytest.mark.asyncio
 async def test_export_user_endpoint(
+    api_client: AsyncClient,
     session_factory: async_sessionmaker[AsyncSession],
-    fake_redis: Any,
-    tmp_path: Path,
 ) -> None:
-    settings = Settings(TELEGRAM_BOT_TOKEN="test", EXPORT_DIR=tmp_path)
-    container = AppContainer(
-        settings=settings,
-        session_factory=session_factory,
-        redis=fake_redis,
-        llm_client=DummyLLM(),
-        stt_client=DummySTT(),
-        notifier=DummyNotifier(),
-    )
-
     async with session_factory() as session:
         users = UserRepository(session)
         events = EventRepository(session)
@@ -129,12 +114,7 @@ async def test_export_user_endpoint(
         )
         await session.commit()
 
-    app = FastAPI()
-    app.include_router(router)
-    app.state.container = container
-
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        response = await client.get("/admin/users/555/export")
+    response = await api_client.get("/admin/users/555/export")
 
     assert response.status_code == 200
     body = response.json()
@@ -144,20 +124,9 @@ async def test_export_user_endpoint(
 
 @pytest.mark.asyncio
 async def test_agent_quality_endpoint(
+    api_client: AsyncClient,
     session_factory: async_sessionmaker[AsyncSession],
-    fake_redis: Any,
-    tmp_path: Path,
 ) -> None:
-    settings = Settings(TELEGRAM_BOT_TOKEN="test", EXPORT_DIR=tmp_path)
-    container = AppContainer(
-        settings=settings,
-        session_factory=session_factory,
-        redis=fake_redis,
-        llm_client=DummyLLM(),
-        stt_client=DummySTT(),
-        notifier=DummyNotifier(),
-    )
-
     async with session_factory() as session:
         users = UserRepository(session)
         traces = AgentRunTraceRepository(session)
@@ -179,12 +148,7 @@ async def test_agent_quality_endpoint(
         )
         await session.commit()
 
-    app = FastAPI()
-    app.include_router(router)
-    app.state.container = container
-
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        response = await client.get("/admin/agent-quality", params={"telegram_id": 777, "days": 7})
+    response = await api_client.get("/admin/agent-quality", params={"telegram_id": 777, "days": 7})
 
     assert response.status_code == 200
     body = response.json()
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from redis.asyncio import Redis
+
+from app.services.stores.pending_action_store import PendingAction, PendingActionStore
+from app.services.stores.session_state_store import SessionStateStore
+
+pytestmark = pytest.mark.redis
+
+
+@pytest.mark.asyncio
+async def test_claim_and_load_pending_returns_state_once(redis_client: Redis) -> None:
+    store = SessionStateStore(redis_client)
+    pending = PendingAction(action="reschedule_lesson", event_id=uuid4())
+    await PendingActionStore(redis_client).put(3, pending)
+
+    assert await store.claim_and_load_pending("msg:text:3:3:1", 3) == (True, pending)
+    assert await store.claim_and_load_pending("msg:text:3:3:1", 3) == (False, None)
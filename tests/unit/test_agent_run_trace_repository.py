@@ -65,3 +65,31 @@ async def test_quality_snapshot_metrics(db_session: AsyncSession) -> None:
     assert metrics["parse_success"] == 0.6667
     assert metrics["clarification_rate"] == 0.3333
     assert metrics["wrong_action_rate"] == 0.3333
+
+
+@pytest.mark.asyncio
+async def test_create_defers_flush_until_batch_is_full(db_session: AsyncSession) -> None:
+    repo = AgentRunTraceRepository(db_session, flush_every=2)
+    traces = [
+        AgentRunTrace(
+            user_id=2,
+            source="parser",
+            input_text=text,
+            locale="ru",
+            timezone="UTC",
+            route_mode="precise",
+            result_intent="create_reminder",
+            confidence=0.9,
+            selected_path=["ok"],
+            stages=[],
+            total_duration_ms=10,
+        )
+        for text in ("a", "b")
+    ]
+
+    await repo.create(traces[0])
+    assert traces[0].id is None
+
+    await repo.create(traces[1])
+    assert traces[0].id is not None
+    assert traces[1].id is not None
@@ -1,26 +1,32 @@
 from __future__ import annotations
 
-from typing import cast
+import asyncio
+from typing import Final, cast
 
 import pytest
 
 from app.db.models import AgentRunTrace
 from app.domain.enums import Intent
+from app.integrations.llm.base import LLMClient
+from app.integrations.llm.cache import CachingLLMClient
 from app.repositories.agent_run_trace_repository import AgentRunTraceRepository
 from app.services.parser.command_parser_service import CommandParserService
 
+INTENT_CREATE_REMINDER: Final = '{"intent":"create_reminder","needs_clarification":false,"question":null}'
+INTENT_LIST_EVENTS: Final = '{"intent":"list_events","needs_clarification":false,"question":null}'
+COMMAND_CREATE_PAYMENT_REMINDER: Final = '{"intent":"create_reminder","title":"Оплата","start_at":"2026-03-01T10:00:00+03:00"}'
+SUPERVISOR_ALL_OR_NOTHING: Final = '{"result":{"strategy":"all_or_nothing","stop_on_error":true},"confidence":0.9,"needs_clarification":false,"clarify_question":null,"reasons":[]}'
 
-class SequenceLLM:
+
+class SequenceLLM(LLMClient):
     def __init__(self, outputs: list[str]) -> None:
-        self._outputs = outputs
-        self._idx = 0
+        self._outputs = iter(outputs)
 
     async def complete(self, prompt: str) -> str:
-        if self._idx >= len(self._outputs):
+        value = next(self._outputs, None)
+        if value is None:
             msg = "No more prepared LLM outputs"
             raise RuntimeError(msg)
-        value = self._outputs[self._idx]
-        self._idx += 1
         return value
 
 
@@ -38,8 +44,8 @@ async def test_parser_accepts_valid_json_from_agents() -> None:
     parser = CommandParserService(
         llm_client=SequenceLLM(
             [
-                '{"intent":"create_reminder","needs_clarification":false,"question":null}',
-                '{"intent":"create_reminder","title":"Оплата","start_at":"2026-03-01T10:00:00+03:00"}',
+                INTENT_CREATE_REMINDER,
+                COMMAND_CREATE_PAYMENT_REMINDER,
             ]
         )
     )
@@ -54,7 +60,7 @@ async def test_parser_recovers_json_from_markdown_block() -> None:
     parser = CommandParserService(
         llm_client=SequenceLLM(
             [
-                '{"intent":"list_events","needs_clarification":false,"question":null}',
+                INTENT_LIST_EVENTS,
                 '```json\n{"intent":"list_events","period":"today"}\n```',
             ]
         )
@@ -70,9 +76,9 @@ async def test_parser_uses_recovery_agent_on_invalid_command_json() -> None:
     parser = CommandParserService(
         llm_client=SequenceLLM(
             [
-                '{"intent":"create_reminder","needs_clarification":false,"question":null}',
+                INTENT_CREATE_REMINDER,
                 '{',
-                '{"intent":"create_reminder","title":"Оплата","start_at":"2026-03-01T10:00:00+03:00"}',
+                COMMAND_CREATE_PAYMENT_REMINDER,
             ]
         )
     )
@@ -151,7 +157,7 @@ async def test_parser_persists_agent_trace() -> None:
     parser = CommandParserService(
         llm_client=SequenceLLM(
             [
-                '{"intent":"list_events","needs_clarification":false,"question":null}',
+                INTENT_LIST_EVENTS,
                 '{"intent":"list_events","period":"today"}',
             ]
         ),
@@ -275,6 +281,70 @@ async def test_primary_assistant_uses_help_knowledge_answer_when_available() ->
     assert result == "Покажу расписание на неделю, день, и помогу с переносами и оплатами."
 
 
+class PrimaryThenHangingLLM(LLMClient):
+    def __init__(self, primary_output: str) -> None:
+        self._primary_output = primary_output
+        self.calls = 0
+        self.cancelled = False
+
+    async def complete(self, prompt: str) -> str:
+        self.calls += 1
+        if self.calls == 1:
+            # Yield once so the speculative help request is actually sent.
+            await asyncio.sleep(0)
+            return self._primary_output
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return ""
+
+
+@pytest.mark.asyncio
+async def test_detailed_primary_answer_cancels_in_flight_help_request() -> None:
+    detailed = (
+        "Я создаю и переношу уроки, веду учеников и оплаты, "
+        "показываю расписание на день и неделю и напоминаю о занятиях заранее."
+    )
+    llm = PrimaryThenHangingLLM(
+        '{"result":{"mode":"answer","answer":"' + detailed + '"},"confidence":0.9,'
+        '"needs_clarification":false,"clarify_question":null,"reasons":[]}'
+    )
+    parser = CommandParserService(llm_client=llm)
+
+    result = await parser.maybe_answer_help(text="что ты умеешь?", locale="ru", timezone="UTC")
+
+    assert result == detailed
+    assert llm.calls == 2
+    assert llm.cancelled is True
+
+
+@pytest.mark.asyncio
+async def test_primary_assistant_skips_help_knowledge_for_detailed_answer() -> None:
+    detailed = (
+        "Я создаю и переношу уроки, веду учеников и оплаты, "
+        "показываю расписание на день и неделю и напоминаю о занятиях заранее."
+    )
+    parser = CommandParserService(
+        llm_client=SequenceLLM(
+            [
+                '{"result":{"mode":"answer","answer":"' + detailed + '"},"confidence":0.9,'
+                '"needs_clarification":false,"clarify_question":null,"reasons":[]}',
+                '{"result":{"answer":"Другой ответ"},"confidence":0.88,"needs_clarification":false,"clarify_question":null,"reasons":[]}',
+            ]
+        )
+    )
+
+    result = await parser.maybe_answer_help(
+        text="что ты умеешь?",
+        locale="ru",
+        timezone="UTC",
+    )
+
+    assert result == detailed
+
+
 @pytest.mark.asyncio
 async def test_conversation_manager_routes_to_answer() -> None:
     parser = CommandParserService(
@@ -304,7 +374,7 @@ async def test_execution_supervisor_returns_all_or_nothing() -> None:
     parser = CommandParserService(
         llm_client=SequenceLLM(
             [
-                '{"result":{"strategy":"all_or_nothing","stop_on_error":true},"confidence":0.9,"needs_clarification":false,"clarify_question":null,"reasons":[]}',
+                SUPERVISOR_ALL_OR_NOTHING,
             ]
         )
     )
@@ -356,6 +426,35 @@ async def test_route_conversation_compresses_large_context() -> None:
     assert answer == "Готово"
 
 
+@pytest.mark.asyncio
+async def test_large_context_is_compressed_once_per_parser() -> None:
+    parser = CommandParserService(
+        llm_client=SequenceLLM(
+            [
+                '{"result":{"summary":"Краткая сводка","facts":[]},"confidence":0.9,"needs_clarification":false,"clarify_question":null,"reasons":[]}',
+                '{"result":{"mode":"answer","operations":[],"answer":"Первый","question":null},"confidence":0.9,"needs_clarification":false,"clarify_question":null,"reasons":[]}',
+                '{"result":{"mode":"answer","operations":[],"answer":"Второй","question":null},"confidence":0.9,"needs_clarification":false,"clarify_question":null,"reasons":[]}',
+            ]
+        )
+    )
+    context: dict[str, object] = {
+        "dialog_history": [{"role": "user", "content": "x" * 5000}],
+        "latest_user_text": "что дальше?",
+    }
+
+    answers = []
+    for _ in range(2):
+        _mode, _ops, answer, _question, _execution_mode, _stop_on_error = await parser.route_conversation(
+            text="что дальше?",
+            locale="ru",
+            timezone="UTC",
+            context=context,
+        )
+        answers.append(answer)
+
+    assert answers == ["Первый", "Второй"]
+
+
 @pytest.mark.asyncio
 async def test_suggest_quick_replies_returns_options() -> None:
     parser = CommandParserService(
@@ -447,7 +546,7 @@ async def test_route_conversation_uses_task_chunking_and_graph_for_long_request(
                 '{"result":{"mode":"commands","operations":["черновик"],"answer":null,"question":null},"confidence":0.88,"needs_clarification":false,"clarify_question":null,"reasons":[]}',
                 '{"result":{"operations":["создай ученика Маша","установи Маше цену 3000","добавь урок Маше в среду 18:00"]},"confidence":0.9,"needs_clarification":false,"clarify_question":null,"reasons":[]}',
                 '{"result":{"operations":["создай ученика Маша","установи Маше цену 3000","добавь урок Маше в среду 18:00"],"execution_mode":"stop_on_error"},"confidence":0.9,"needs_clarification":false,"clarify_question":null,"reasons":[]}',
-                '{"result":{"strategy":"all_or_nothing","stop_on_error":true},"confidence":0.9,"needs_clarification":false,"clarify_question":null,"reasons":[]}',
+                SUPERVISOR_ALL_OR_NOTHING,
             ]
         )
     )
@@ -465,3 +564,54 @@ async def test_route_conversation_uses_task_chunking_and_graph_for_long_request(
     assert len(ops) == 3
     assert strategy == "all_or_nothing"
     assert stop_on_error is True
+
+
+@pytest.mark.asyncio
+async def test_repeated_risk_assessment_is_served_from_llm_cache() -> None:
+    cached = CachingLLMClient(
+        SequenceLLM(
+            [
+                '{"result":{"requires_confirmation":true,"risk_level":"high","summary":"Удалить все уроки"},"confidence":0.9,"needs_clarification":false,"clarify_question":null,"reasons":[]}',
+            ]
+        )
+    )
+    parser = CommandParserService(llm_client=SequenceLLM([]), cached_llm_client=cached)
+
+    for _ in range(2):
+        requires_confirmation, risk_level, _preview = await parser.assess_plan_risk(
+            text="удали все уроки",
+            operations=["удали все уроки"],
+            locale="ru",
+            timezone="UTC",
+        )
+        assert requires_confirmation is True
+        assert risk_level == "high"
+
+    assert cached.cache_stats["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_malformed_risk_assessment_is_not_replayed_from_cache() -> None:
+    cached = CachingLLMClient(
+        SequenceLLM(
+            [
+                "not json",
+                '{"result":{"requires_confirmation":true,"risk_level":"high","summary":"Удалить все уроки"},"confidence":0.9,"needs_clarification":false,"clarify_question":null,"reasons":[]}',
+            ]
+        )
+    )
+    parser = CommandParserService(llm_client=SequenceLLM([]), cached_llm_client=cached)
+
+    results = [
+        await parser.assess_plan_risk(
+            text="удали все уроки",
+            operations=["удали все уроки"],
+            locale="ru",
+            timezone="UTC",
+        )
+        for _ in range(2)
+    ]
+
+    assert results[0] == (False, "low", "")
+    assert results[1][:2] == (True, "high")
+    assert cached.cache_stats == {"hits": 0, "misses": 2, "size": 1}
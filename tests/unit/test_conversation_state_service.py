@@ -1,34 +1,28 @@
 from __future__ import annotations
 
+from collections import deque
+from unittest.mock import AsyncMock
+
 import pytest
 
 from app.db.models import User
 from app.services.assistant.conversation_state_service import ConversationStateService
-from app.services.stores.dialog_state_store import DialogState
-
-
-class _FakeStore:
-    def __init__(self) -> None:
-        self.state = DialogState()
-
-    async def get(self, telegram_id: int) -> DialogState:
-        return self.state
-
-    async def save(self, telegram_id: int, state: DialogState) -> None:
-        self.state = state
+from app.services.events.event_service import EventService
+from app.services.stores.dialog_state_store import DialogState, DialogStateStore
 
 
-class _FakeEventService:
-    async def compact_user_context(self, user: User) -> dict[str, object]:
-        return {"user_id": user.id, "timezone": user.timezone}
+def _fake_event_service() -> AsyncMock:
+    events = AsyncMock(spec=EventService)
+    events.compact_user_context.return_value = {"user_id": 7, "timezone": "UTC"}
+    return events
 
 
 @pytest.mark.asyncio
 async def test_save_state_clears_pending_when_scenario_is_inactive() -> None:
-    store = _FakeStore()
+    store = AsyncMock(spec=DialogStateStore)
     service = ConversationStateService(
-        dialog_state_store=store,  # type: ignore[arg-type]
-        event_service=_FakeEventService(),  # type: ignore[arg-type]
+        dialog_state_store=store,
+        event_service=_fake_event_service(),
     )
     state = DialogState(pending_question="q", pending_reason="r")
 
@@ -39,20 +33,21 @@ async def test_save_state_clears_pending_when_scenario_is_inactive() -> None:
         assistant_text="a",
     )
 
-    assert store.state.pending_question is None
-    assert store.state.pending_reason is None
-    assert len(store.state.turns) == 2
+    store.save.assert_awaited_once_with(1, state)
+    assert state.pending_question is None
+    assert state.pending_reason is None
+    assert len(state.turns) == 2
 
 
 @pytest.mark.asyncio
 async def test_build_context_package_includes_backend_state() -> None:
     service = ConversationStateService(
         dialog_state_store=None,
-        event_service=_FakeEventService(),  # type: ignore[arg-type]
+        event_service=_fake_event_service(),
     )
     user = User(telegram_id=1007, language="ru", timezone="UTC")
     user.id = 7
-    state = DialogState(turns=[{"role": "user", "content": "hello"}])
+    state = DialogState(turns=deque([{"role": "user", "content": "hello"}]))
 
     context = await service.build_context_package(
         user=user,
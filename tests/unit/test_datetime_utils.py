@@ -2,7 +2,12 @@
 
 from datetime import UTC, datetime
 
-from app.core.datetime_utils import ensure_utc, next_weekday_time, parse_datetime_input
+from app.core.datetime_utils import (
+    ensure_utc,
+    next_weekday_time,
+    parse_datetime_input,
+    parse_local_iso,
+)
 
 
 def test_ensure_utc_on_naive_datetime() -> None:
@@ -20,6 +25,13 @@ def test_parse_datetime_input_iso() -> None:
     assert parsed.tzinfo == UTC
 
 
+def test_parse_local_iso_uses_user_timezone() -> None:
+    parsed = parse_local_iso("2026-03-10", "18:00", timezone="Europe/Moscow")
+
+    assert parsed == datetime(2026, 3, 10, 15, 0, tzinfo=UTC)
+    assert parse_local_iso("10.03.2026", "18:00", timezone="Europe/Moscow") is None
+
+
 def test_next_weekday_time_returns_future_datetime() -> None:
     now = datetime(2026, 2, 19, 10, 0, tzinfo=UTC)
     nxt = next_weekday_time("FR", "12:00", timezone="UTC", now_utc=now)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from app.services.stores.dialog_state_store import DialogState, DialogStateStore
+
+
+@pytest.mark.asyncio
+async def test_dialog_state_round_trip(fake_redis: Any) -> None:
+    store = DialogStateStore(fake_redis, max_turns=2)
+    state = DialogState()
+    state.turns.append({"role": "user", "content": "первый"})
+    state.turns.append({"role": "assistant", "content": "второй"})
+    state.turns.append({"role": "user", "content": "третий"})
+    state.pending_question = "Во сколько?"
+    state.pending_reason = "missing_required_data"
+
+    await store.save(1, state)
+    loaded = await store.get(1)
+
+    assert list(loaded.turns) == [
+        {"role": "assistant", "content": "второй"},
+        {"role": "user", "content": "третий"},
+    ]
+    assert loaded.pending_question == "Во сколько?"
+    assert loaded.pending_reason == "missing_required_data"
+
+
+def test_decode_drops_malformed_turns_and_keeps_the_rest(fake_redis: Any) -> None:
+    store = DialogStateStore(fake_redis)
+    raw = (
+        b'{"turns":[{"role":"user","content":"first"},{"role":["bad"],"content":"x"},'
+        b'"not a turn",{"role":"assistant","content":"second"}],'
+        b'"pending_question":"When?","scenario_payload":["not","a","dict"]}'
+    )
+
+    state = store.decode(raw)
+
+    assert list(state.turns) == [
+        {"role": "user", "content": "first"},
+        {"role": "assistant", "content": "second"},
+    ]
+    assert state.pending_question == "When?"
+    assert state.scenario_payload == {}
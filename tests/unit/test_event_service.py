@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
+from itertools import count
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import Event
+from app.db.models import Event, Student, User
 from app.domain.commands import (
     CreateBirthdayCommand,
     CreateReminderCommand,
@@ -29,14 +32,54 @@ from app.repositories.user_repository import UserRepository
 from app.services.events.event_service import EventService
 
 
-@pytest.mark.asyncio
-async def test_create_reminder(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events = EventRepository(db_session)
-    service = EventService(events)
+def assert_all_in(text: str, needles: Iterable[str]) -> None:
+    missing = [needle for needle in needles if needle not in text]
+    assert not missing, f"missing {missing} in {text!r}"
+
+
+@dataclass(slots=True)
+class TutorContext:
+    session: AsyncSession
+    users: UserRepository
+    events: EventRepository
+    students: StudentRepository
+    payments: PaymentTransactionRepository
+    _telegram_ids: Iterator[int] = field(default_factory=lambda: count(1))
 
-    user = await users.get_or_create(telegram_id=1, language="ru")
-    user.timezone = "UTC"
+    async def new_user(self, timezone: str = "UTC") -> User:
+        user = await self.users.get_or_create(telegram_id=next(self._telegram_ids), language="ru")
+        user.timezone = timezone
+        return user
+
+    def service_with(self, *, students: bool = False, payments: bool = False) -> EventService:
+        return EventService(
+            self.events,
+            student_repository=self.students if students else None,
+            payment_repository=self.payments if payments else None,
+        )
+
+    async def add_student(self, user: User, name: str, **fields: int) -> Student:
+        student = Student(user_id=user.id, name=name, **fields)
+        self.session.add(student)
+        await self.session.flush()
+        return student
+
+
+@pytest.fixture
+def tutor_ctx(db_session: AsyncSession) -> TutorContext:
+    return TutorContext(
+        session=db_session,
+        users=UserRepository(db_session),
+        events=EventRepository(db_session),
+        students=StudentRepository(db_session),
+        payments=PaymentTransactionRepository(db_session),
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_reminder(db_session: AsyncSession, tutor_ctx: TutorContext) -> None:
+    service = tutor_ctx.service_with()
+    user = await tutor_ctx.new_user()
 
     cmd = CreateReminderCommand(
         intent=Intent.CREATE_REMINDER,
@@ -48,19 +91,15 @@ async def test_create_reminder(db_session: AsyncSession) -> None:
     message = await service.create_reminder(user, cmd)
     await db_session.commit()
 
-    all_events = await events.list_for_user(user.id)
+    all_events = await tutor_ctx.events.list_for_user(user.id)
     assert len(all_events) == 1
     assert "создано" in message.lower()
 
 
 @pytest.mark.asyncio
-async def test_create_schedule(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events = EventRepository(db_session)
-    service = EventService(events)
-
-    user = await users.get_or_create(telegram_id=2, language="ru")
-    user.timezone = "Europe/Moscow"
+async def test_create_schedule(db_session: AsyncSession, tutor_ctx: TutorContext) -> None:
+    service = tutor_ctx.service_with()
+    user = await tutor_ctx.new_user(timezone="Europe/Moscow")
 
     cmd = CreateScheduleCommand(
         intent=Intent.CREATE_SCHEDULE,
@@ -73,64 +112,101 @@ async def test_create_schedule(db_session: AsyncSession) -> None:
     text = await service.create_schedule(user, cmd)
     await db_session.commit()
 
-    all_events = await events.list_for_user(user.id)
+    all_events = await tutor_ctx.events.list_for_user(user.id)
     assert len(all_events) == 2
     assert "2" in text
 
 
 @pytest.mark.asyncio
-async def test_create_birthday(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events = EventRepository(db_session)
-    service = EventService(events)
-
-    user = await users.get_or_create(telegram_id=3, language="ru")
-    user.timezone = "UTC"
+async def test_create_birthday(db_session: AsyncSession, tutor_ctx: TutorContext) -> None:
+    service = tutor_ctx.service_with()
+    user = await tutor_ctx.new_user()
 
     cmd = CreateBirthdayCommand(intent=Intent.CREATE_BIRTHDAY, person="Анна", date="14 мая")
     text = await service.create_birthday(user, cmd)
     await db_session.commit()
 
-    all_events = await events.list_for_user(user.id)
+    all_events = await tutor_ctx.events.list_for_user(user.id)
     assert len(all_events) == 1
     assert all_events[0].rrule == "FREQ=YEARLY"
     assert "Анна" in text
 
 
 @pytest.mark.asyncio
-async def test_list_events_today(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events_repo = EventRepository(db_session)
-    service = EventService(events_repo)
-
-    user = await users.get_or_create(telegram_id=4, language="ru")
-    user.timezone = "UTC"
-
-    event = Event(
-        user_id=user.id,
-        event_type="reminder",
-        title="Today event",
-        starts_at=datetime.now(tz=UTC).replace(hour=12, minute=0, second=0, microsecond=0),
-        rrule=None,
-        remind_offsets=[0],
-        extra_data={},
+@pytest.mark.parametrize(
+    ("command", "present", "absent"),
+    [
+        pytest.param(
+            ListEventsCommand(intent=Intent.LIST_EVENTS, period="today"),
+            "Today event",
+            None,
+            id="today",
+        ),
+        pytest.param(
+            ListEventsCommand(intent=Intent.LIST_EVENTS, period="all", student_name="Маша"),
+            "Маша",
+            "Иван",
+            id="filters-by-student-name",
+        ),
+    ],
+)
+async def test_list_events(
+    db_session: AsyncSession,
+    tutor_ctx: TutorContext,
+    command: ListEventsCommand,
+    present: str,
+    absent: str | None,
+) -> None:
+    service = tutor_ctx.service_with()
+    user = await tutor_ctx.new_user()
+    now = datetime.now(tz=UTC)
+
+    await tutor_ctx.events.create_many(
+        [
+            Event(
+                user_id=user.id,
+                event_type="reminder",
+                title="Today event",
+                starts_at=now.replace(hour=12, minute=0, second=0, microsecond=0),
+                rrule=None,
+                remind_offsets=[0],
+                extra_data={},
+            ),
+            Event(
+                user_id=user.id,
+                event_type="lesson",
+                title="Маша",
+                starts_at=now + timedelta(hours=2),
+                ends_at=now + timedelta(hours=3),
+                rrule=None,
+                remind_offsets=[15],
+                extra_data={"student_name": "Маша"},
+            ),
+            Event(
+                user_id=user.id,
+                event_type="lesson",
+                title="Иван",
+                starts_at=now + timedelta(hours=4),
+                ends_at=now + timedelta(hours=5),
+                rrule=None,
+                remind_offsets=[15],
+                extra_data={"student_name": "Иван"},
+            ),
+        ]
     )
-    await events_repo.create(event)
     await db_session.commit()
 
-    text = await service.list_events(user, ListEventsCommand(intent=Intent.LIST_EVENTS, period="today"))
+    text = await service.list_events(user, command)
 
-    assert "Today event" in text
+    assert present in text
+    if absent is not None:
+        assert absent not in text
 
 
 @pytest.mark.asyncio
-async def test_update_reminder(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events_repo = EventRepository(db_session)
-    service = EventService(events_repo)
-
-    user = await users.get_or_create(telegram_id=5, language="ru")
-    user.timezone = "UTC"
+async def test_update_reminder(db_session: AsyncSession, tutor_ctx: TutorContext) -> None:
+    service = tutor_ctx.service_with()
+    user = await tutor_ctx.new_user()
 
     event = Event(
         user_id=user.id,
@@ -141,26 +217,22 @@ async def test_update_reminder(db_session: AsyncSession) -> None:
         remind_offsets=[0],
         extra_data={},
     )
-    await events_repo.create(event)
-    await db_session.commit()
+    await tutor_ctx.events.create(event)
+    await db_session.flush()
 
     cmd = UpdateReminderCommand(intent=Intent.UPDATE_REMINDER, search_text="Old", title="New title")
     text = await service.update_reminder(user, cmd)
     await db_session.commit()
 
-    found = await events_repo.find_by_title(user.id, "New")
+    found = await tutor_ctx.events.find_by_title(user.id, "New")
     assert found is not None
     assert text == "Событие обновлено."
 
 
 @pytest.mark.asyncio
-async def test_delete_reminder(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events_repo = EventRepository(db_session)
-    service = EventService(events_repo)
-
-    user = await users.get_or_create(telegram_id=6, language="ru")
-    user.timezone = "UTC"
+async def test_delete_reminder(db_session: AsyncSession, tutor_ctx: TutorContext) -> None:
+    service = tutor_ctx.service_with()
+    user = await tutor_ctx.new_user()
 
     event = Event(
         user_id=user.id,
@@ -171,109 +243,58 @@ async def test_delete_reminder(db_session: AsyncSession) -> None:
         remind_offsets=[0],
         extra_data={},
     )
-    await events_repo.create(event)
-    await db_session.commit()
+    await tutor_ctx.events.create(event)
+    await db_session.flush()
 
     cmd = DeleteReminderCommand(intent=Intent.DELETE_REMINDER, search_text="Delete")
     text = await service.delete_reminder(user, cmd)
     await db_session.commit()
 
-    still_active = await events_repo.list_for_user(user.id, only_active=True)
+    still_active = await tutor_ctx.events.list_for_user(user.id, only_active=True)
     assert not still_active
     assert "удалено" in text
 
 
 @pytest.mark.asyncio
-async def test_list_events_filters_by_student_name(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events_repo = EventRepository(db_session)
-    service = EventService(events_repo)
-
-    user = await users.get_or_create(telegram_id=7, language="ru")
-    user.timezone = "UTC"
-
-    event_masha = Event(
-        user_id=user.id,
-        event_type="lesson",
-        title="Маша",
-        starts_at=datetime.now(tz=UTC) + timedelta(hours=2),
-        ends_at=datetime.now(tz=UTC) + timedelta(hours=3),
-        rrule=None,
-        remind_offsets=[15],
-        extra_data={"student_name": "Маша"},
-    )
-    event_ivan = Event(
-        user_id=user.id,
-        event_type="lesson",
-        title="Иван",
-        starts_at=datetime.now(tz=UTC) + timedelta(hours=4),
-        ends_at=datetime.now(tz=UTC) + timedelta(hours=5),
-        rrule=None,
-        remind_offsets=[15],
-        extra_data={"student_name": "Иван"},
-    )
-    await events_repo.create(event_masha)
-    await events_repo.create(event_ivan)
-    await db_session.commit()
-
-    text = await service.list_events(
-        user,
-        ListEventsCommand(intent=Intent.LIST_EVENTS, period="all", student_name="Маша"),
-    )
-
-    assert "Маша" in text
-    assert "Иван" not in text
-
-
-@pytest.mark.asyncio
-async def test_tutor_day_report_contains_load_and_windows(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events_repo = EventRepository(db_session)
-    service = EventService(events_repo)
-
-    user = await users.get_or_create(telegram_id=8, language="ru")
-    user.timezone = "UTC"
+async def test_tutor_day_report_contains_load_and_windows(db_session: AsyncSession, tutor_ctx: TutorContext) -> None:
+    service = tutor_ctx.service_with()
+    user = await tutor_ctx.new_user()
 
     base = datetime.now(tz=UTC).replace(hour=10, minute=0, second=0, microsecond=0)
-    await events_repo.create(
-        Event(
-            user_id=user.id,
-            event_type="lesson",
-            title="Маша",
-            starts_at=base,
-            ends_at=base + timedelta(minutes=60),
-            rrule=None,
-            remind_offsets=[15],
-            extra_data={"student_name": "Маша"},
-        )
-    )
-    await events_repo.create(
-        Event(
-            user_id=user.id,
-            event_type="lesson",
-            title="Иван",
-            starts_at=base + timedelta(minutes=120),
-            ends_at=base + timedelta(minutes=180),
-            rrule=None,
-            remind_offsets=[15],
-            extra_data={"student_name": "Иван"},
-        )
+    await tutor_ctx.events.create_many(
+        [
+            Event(
+                user_id=user.id,
+                event_type="lesson",
+                title="Маша",
+                starts_at=base,
+                ends_at=base + timedelta(minutes=60),
+                rrule=None,
+                remind_offsets=[15],
+                extra_data={"student_name": "Маша"},
+            ),
+            Event(
+                user_id=user.id,
+                event_type="lesson",
+                title="Иван",
+                starts_at=base + timedelta(minutes=120),
+                ends_at=base + timedelta(minutes=180),
+                rrule=None,
+                remind_offsets=[15],
+                extra_data={"student_name": "Иван"},
+            ),
+        ]
     )
     await db_session.commit()
 
     text = await service.tutor_day_report(user=user, day=base.date())
-    assert "Нагрузка" in text
-    assert "Свободные окна" in text
+    assert_all_in(text, ("Нагрузка", "Свободные окна"))
 
 
 @pytest.mark.asyncio
-async def test_update_schedule_reschedule_single_week_creates_override(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events_repo = EventRepository(db_session)
-    service = EventService(events_repo)
-
-    user = await users.get_or_create(telegram_id=9, language="ru")
-    user.timezone = "UTC"
+async def test_update_schedule_reschedule_single_week_creates_override(db_session: AsyncSession, tutor_ctx: TutorContext) -> None:
+    service = tutor_ctx.service_with()
+    user = await tutor_ctx.new_user()
 
     base = datetime(2026, 3, 2, 17, 0, tzinfo=UTC)
     lesson = Event(
@@ -286,8 +307,8 @@ async def test_update_schedule_reschedule_single_week_creates_override(db_sessio
         remind_offsets=[15],
         extra_data={"weekday": "MO", "time": "17:00", "student_name": "Маша"},
     )
-    await events_repo.create(lesson)
-    await db_session.commit()
+    await tutor_ctx.events.create(lesson)
+    await db_session.flush()
 
     text = await service.update_schedule(
         user,
@@ -303,24 +324,21 @@ async def test_update_schedule_reschedule_single_week_creates_override(db_sessio
     await db_session.commit()
 
     assert "только для этой недели" in text
-    all_events = await events_repo.list_for_user(user.id, only_active=True)
+    all_events = await tutor_ctx.events.list_for_user(user.id, only_active=True)
     assert len(all_events) == 2
 
 
 @pytest.mark.asyncio
-async def test_mark_lesson_paid_with_subscription_warns_last_lesson(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events_repo = EventRepository(db_session)
-    students_repo = StudentRepository(db_session)
-    service = EventService(events_repo, student_repository=students_repo)
-
-    user = await users.get_or_create(telegram_id=10, language="ru")
-    user.timezone = "UTC"
+async def test_mark_lesson_paid_with_subscription_warns_last_lesson(db_session: AsyncSession, tutor_ctx: TutorContext) -> None:
+    service = tutor_ctx.service_with(students=True)
+    user = await tutor_ctx.new_user()
 
-    student = await students_repo.get_or_create_by_name(user.id, "Маша")
-    student.subscription_total_lessons = 8
-    student.subscription_remaining_lessons = 2
-    await students_repo.update(student)
+    student = await tutor_ctx.add_student(
+        user,
+        "Маша",
+        subscription_total_lessons=8,
+        subscription_remaining_lessons=2,
+    )
 
     lesson = Event(
         user_id=user.id,
@@ -332,8 +350,8 @@ async def test_mark_lesson_paid_with_subscription_warns_last_lesson(db_session:
         remind_offsets=[15],
         extra_data={"student_name": "Маша", "student_id": str(student.id)},
     )
-    await events_repo.create(lesson)
-    await db_session.commit()
+    await tutor_ctx.events.create(lesson)
+    await db_session.flush()
 
     text = await service.mark_lesson_paid(
         user=user,
@@ -345,14 +363,9 @@ async def test_mark_lesson_paid_with_subscription_warns_last_lesson(db_session:
 
 
 @pytest.mark.asyncio
-async def test_cancel_lesson_counts_tutor_cancellation(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events_repo = EventRepository(db_session)
-    students_repo = StudentRepository(db_session)
-    service = EventService(events_repo, student_repository=students_repo)
-
-    user = await users.get_or_create(telegram_id=11, language="ru")
-    user.timezone = "UTC"
+async def test_cancel_lesson_counts_tutor_cancellation(db_session: AsyncSession, tutor_ctx: TutorContext) -> None:
+    service = tutor_ctx.service_with(students=True)
+    user = await tutor_ctx.new_user()
     lesson = Event(
         user_id=user.id,
         event_type="lesson",
@@ -363,8 +376,8 @@ async def test_cancel_lesson_counts_tutor_cancellation(db_session: AsyncSession)
         remind_offsets=[15],
         extra_data={},
     )
-    await events_repo.create(lesson)
-    await db_session.commit()
+    await tutor_ctx.events.create(lesson)
+    await db_session.flush()
 
     text = await service.cancel_lesson(user=user, event_id=lesson.id, canceled_by="tutor")
     await db_session.commit()
@@ -372,50 +385,44 @@ async def test_cancel_lesson_counts_tutor_cancellation(db_session: AsyncSession)
 
 
 @pytest.mark.asyncio
-async def test_finance_report_contains_period_summary(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events_repo = EventRepository(db_session)
-    students_repo = StudentRepository(db_session)
-    service = EventService(events_repo, student_repository=students_repo)
-    user = await users.get_or_create(telegram_id=12, language="ru")
-    user.timezone = "UTC"
+async def test_finance_report_contains_period_summary(db_session: AsyncSession, tutor_ctx: TutorContext) -> None:
+    service = tutor_ctx.service_with(students=True)
+    user = await tutor_ctx.new_user()
+    now = datetime.now(tz=UTC)
     lesson = Event(
         user_id=user.id,
         event_type="lesson",
         title="Катя",
-        starts_at=datetime.now(tz=UTC) - timedelta(days=1),
-        ends_at=datetime.now(tz=UTC),
+        starts_at=now - timedelta(days=1),
+        ends_at=now,
         rrule=None,
         remind_offsets=[15],
-        extra_data={"payment_status": "paid", "payment_amount": 2500, "payment_paid_at": datetime.now(tz=UTC).isoformat()},
+        extra_data={"payment_status": "paid", "payment_amount": 2500, "payment_paid_at": now.isoformat()},
     )
-    await events_repo.create(lesson)
+    await tutor_ctx.events.create(lesson)
     await db_session.commit()
 
     text = await service.tutor_finance_report(user=user, period_days=7)
-    assert "Финансы" in text
-    assert "Оплачено" in text
+    assert_all_in(text, ("Финансы", "Оплачено"))
 
 
 @pytest.mark.asyncio
-async def test_suggest_reschedule_slots_returns_candidates(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events_repo = EventRepository(db_session)
-    service = EventService(events_repo)
-    user = await users.get_or_create(telegram_id=13, language="ru")
-    user.timezone = "UTC"
+async def test_suggest_reschedule_slots_returns_candidates(db_session: AsyncSession, tutor_ctx: TutorContext) -> None:
+    service = tutor_ctx.service_with()
+    user = await tutor_ctx.new_user()
+    now = datetime.now(tz=UTC)
 
     lesson = Event(
         user_id=user.id,
         event_type="lesson",
         title="Миша",
-        starts_at=datetime.now(tz=UTC) + timedelta(hours=1),
-        ends_at=datetime.now(tz=UTC) + timedelta(hours=2),
+        starts_at=now + timedelta(hours=1),
+        ends_at=now + timedelta(hours=2),
         rrule=None,
         remind_offsets=[15],
         extra_data={},
     )
-    await events_repo.create(lesson)
+    await tutor_ctx.events.create(lesson)
     await db_session.commit()
 
     slots = await service.suggest_reschedule_slots(user=user, event=lesson, limit=3)
@@ -423,71 +430,56 @@ async def test_suggest_reschedule_slots_returns_candidates(db_session: AsyncSess
 
 
 @pytest.mark.asyncio
-async def test_set_initial_prepaid_balance_without_lesson_event(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events_repo = EventRepository(db_session)
-    students_repo = StudentRepository(db_session)
-    service = EventService(events_repo, student_repository=students_repo)
-    user = await users.get_or_create(telegram_id=14, language="ru")
-    user.timezone = "UTC"
+@pytest.mark.parametrize(
+    ("student_name", "initial_remaining", "paid_kwargs", "expected_remaining"),
+    [
+        pytest.param("Оля", None, {"prepaid_lessons_set": 6, "payment_total": 18000}, 6, id="set-initial"),
+        pytest.param("Петя", 3, {"prepaid_lessons_add": 5}, 8, id="add"),
+    ],
+)
+async def test_prepaid_balance_without_lesson_event(
+    db_session: AsyncSession,
+    tutor_ctx: TutorContext,
+    student_name: str,
+    initial_remaining: int | None,
+    paid_kwargs: dict[str, int],
+    expected_remaining: int,
+) -> None:
+    service = tutor_ctx.service_with(students=True)
+    user = await tutor_ctx.new_user()
+
+    if initial_remaining is not None:
+        await tutor_ctx.add_student(
+            user,
+            student_name,
+            subscription_remaining_lessons=initial_remaining,
+        )
 
     text = await service.mark_lesson_paid(
         user=user,
         event_id=None,
-        search_text="Оля",
-        prepaid_lessons_set=6,
-        payment_total=18000,
+        search_text=student_name,
+        **paid_kwargs,
     )
     await db_session.commit()
 
-    student = await students_repo.find_by_name(user.id, "Оля")
-    assert student is not None
-    assert student.subscription_remaining_lessons == 6
-    assert "осталось 6" in text
+    updated = await tutor_ctx.students.find_by_name(user.id, student_name)
+    assert updated is not None
+    assert updated.subscription_remaining_lessons == expected_remaining
+    assert f"осталось {expected_remaining}" in text
 
 
 @pytest.mark.asyncio
-async def test_add_prepaid_balance_without_lesson_event(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events_repo = EventRepository(db_session)
-    students_repo = StudentRepository(db_session)
-    service = EventService(events_repo, student_repository=students_repo)
-    user = await users.get_or_create(telegram_id=15, language="ru")
-    user.timezone = "UTC"
-
-    student = await students_repo.get_or_create_by_name(user.id, "Петя")
-    student.subscription_remaining_lessons = 3
-    await students_repo.update(student)
-    await db_session.commit()
+async def test_payment_total_auto_converts_to_lessons_by_default_price(db_session: AsyncSession, tutor_ctx: TutorContext) -> None:
+    service = tutor_ctx.service_with(students=True)
+    user = await tutor_ctx.new_user()
 
-    text = await service.mark_lesson_paid(
-        user=user,
-        event_id=None,
-        search_text="Петя",
-        prepaid_lessons_add=5,
+    await tutor_ctx.add_student(
+        user,
+        "Маша",
+        default_lesson_price=2500,
+        subscription_remaining_lessons=1,
     )
-    await db_session.commit()
-
-    updated = await students_repo.find_by_name(user.id, "Петя")
-    assert updated is not None
-    assert updated.subscription_remaining_lessons == 8
-    assert "осталось 8" in text
-
-
-@pytest.mark.asyncio
-async def test_payment_total_auto_converts_to_lessons_by_default_price(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events_repo = EventRepository(db_session)
-    students_repo = StudentRepository(db_session)
-    service = EventService(events_repo, student_repository=students_repo)
-    user = await users.get_or_create(telegram_id=16, language="ru")
-    user.timezone = "UTC"
-
-    student = await students_repo.get_or_create_by_name(user.id, "Маша")
-    student.default_lesson_price = 2500
-    student.subscription_remaining_lessons = 1
-    await students_repo.update(student)
-    await db_session.commit()
 
     text = await service.mark_lesson_paid(
         user=user,
@@ -497,22 +489,18 @@ async def test_payment_total_auto_converts_to_lessons_by_default_price(db_sessio
     )
     await db_session.commit()
 
-    updated = await students_repo.find_by_name(user.id, "Маша")
+    updated = await tutor_ctx.students.find_by_name(user.id, "Маша")
     assert updated is not None
     assert updated.subscription_remaining_lessons == 5
     assert "осталось 5" in text
 
 
 @pytest.mark.asyncio
-async def test_payment_total_requests_clarification_when_lesson_price_unknown(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events_repo = EventRepository(db_session)
-    students_repo = StudentRepository(db_session)
-    service = EventService(events_repo, student_repository=students_repo)
-    user = await users.get_or_create(telegram_id=17, language="ru")
-    user.timezone = "UTC"
-
-    await students_repo.get_or_create_by_name(user.id, "Иван")
+async def test_payment_total_requests_clarification_when_lesson_price_unknown(db_session: AsyncSession, tutor_ctx: TutorContext) -> None:
+    service = tutor_ctx.service_with(students=True)
+    user = await tutor_ctx.new_user()
+
+    await tutor_ctx.add_student(user, "Иван")
     await db_session.commit()
 
     text = await service.mark_lesson_paid(
@@ -526,13 +514,9 @@ async def test_payment_total_requests_clarification_when_lesson_price_unknown(db
 
 
 @pytest.mark.asyncio
-async def test_update_student_lesson_price(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events_repo = EventRepository(db_session)
-    students_repo = StudentRepository(db_session)
-    service = EventService(events_repo, student_repository=students_repo)
-    user = await users.get_or_create(telegram_id=18, language="ru")
-    user.timezone = "UTC"
+async def test_update_student_lesson_price(db_session: AsyncSession, tutor_ctx: TutorContext) -> None:
+    service = tutor_ctx.service_with(students=True)
+    user = await tutor_ctx.new_user()
 
     text = await service.update_student(
         user=user,
@@ -544,74 +528,61 @@ async def test_update_student_lesson_price(db_session: AsyncSession) -> None:
     )
     await db_session.commit()
 
-    student = await students_repo.find_by_name(user.id, "Лена")
+    student = await tutor_ctx.students.find_by_name(user.id, "Лена")
     assert student is not None
     assert student.default_lesson_price == 2700
     assert "обновлена" in text
 
 
 @pytest.mark.asyncio
-async def test_mark_lesson_paid_creates_ledger_transaction(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events_repo = EventRepository(db_session)
-    students_repo = StudentRepository(db_session)
-    payment_repo = PaymentTransactionRepository(db_session)
-    service = EventService(events_repo, student_repository=students_repo, payment_repository=payment_repo)
-    user = await users.get_or_create(telegram_id=19, language="ru")
-    user.timezone = "UTC"
-    student = await students_repo.get_or_create_by_name(user.id, "Рома")
-    student.subscription_remaining_lessons = 3
-    await students_repo.update(student)
+async def test_mark_lesson_paid_creates_ledger_transaction(db_session: AsyncSession, tutor_ctx: TutorContext) -> None:
+    service = tutor_ctx.service_with(students=True, payments=True)
+    user = await tutor_ctx.new_user()
+    now = datetime.now(tz=UTC)
+    student = await tutor_ctx.add_student(user, "Рома", subscription_remaining_lessons=3)
     lesson = Event(
         user_id=user.id,
         event_type="lesson",
         title="Рома",
-        starts_at=datetime.now(tz=UTC),
-        ends_at=datetime.now(tz=UTC) + timedelta(minutes=60),
+        starts_at=now,
+        ends_at=now + timedelta(minutes=60),
         rrule=None,
         remind_offsets=[15],
         extra_data={"student_name": "Рома", "student_id": str(student.id)},
     )
-    await events_repo.create(lesson)
-    await db_session.commit()
+    await tutor_ctx.events.create(lesson)
+    await db_session.flush()
 
     _ = await service.mark_lesson_paid(user=user, event_id=lesson.id, amount=3000)
     await db_session.commit()
-    items = await payment_repo.list_for_user(user.id)
+    items = await tutor_ctx.payments.list_for_user(user.id)
     assert len(items) >= 1
     assert items[0].amount >= 3000
 
 
 @pytest.mark.asyncio
-async def test_student_card_contains_main_fields(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events_repo = EventRepository(db_session)
-    students_repo = StudentRepository(db_session)
-    service = EventService(events_repo, student_repository=students_repo)
-    user = await users.get_or_create(telegram_id=20, language="ru")
-    user.timezone = "UTC"
-    student = await students_repo.get_or_create_by_name(user.id, "Алина")
-    student.default_lesson_price = 2200
-    student.subscription_remaining_lessons = 4
-    await students_repo.update(student)
+async def test_student_card_contains_main_fields(db_session: AsyncSession, tutor_ctx: TutorContext) -> None:
+    service = tutor_ctx.service_with(students=True)
+    user = await tutor_ctx.new_user()
+    await tutor_ctx.add_student(
+        user,
+        "Алина",
+        default_lesson_price=2200,
+        subscription_remaining_lessons=4,
+    )
     await db_session.commit()
 
     text = await service.student_card(
         user=user,
         cmd=StudentCardCommand(intent=Intent.STUDENT_CARD, student_name="Алина", view="card"),
     )
-    assert "Карточка ученика" in text
-    assert "Предоплачено занятий" in text
+    assert_all_in(text, ("Карточка ученика", "Предоплачено занятий"))
 
 
 @pytest.mark.asyncio
-async def test_parse_bank_transfer_requires_student_and_amount(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events_repo = EventRepository(db_session)
-    students_repo = StudentRepository(db_session)
-    service = EventService(events_repo, student_repository=students_repo)
-    user = await users.get_or_create(telegram_id=21, language="ru")
-    user.timezone = "UTC"
+async def test_parse_bank_transfer_requires_student_and_amount(tutor_ctx: TutorContext) -> None:
+    service = tutor_ctx.service_with(students=True)
+    user = await tutor_ctx.new_user()
 
     text, student_name, amount = await service.parse_bank_transfer(
         user=user,
@@ -623,19 +594,15 @@ async def test_parse_bank_transfer_requires_student_and_amount(db_session: Async
 
 
 @pytest.mark.asyncio
-async def test_create_and_delete_student(db_session: AsyncSession) -> None:
-    users = UserRepository(db_session)
-    events_repo = EventRepository(db_session)
-    students_repo = StudentRepository(db_session)
-    service = EventService(events_repo, student_repository=students_repo)
-    user = await users.get_or_create(telegram_id=22, language="ru")
-    user.timezone = "UTC"
+async def test_create_and_delete_student(db_session: AsyncSession, tutor_ctx: TutorContext) -> None:
+    service = tutor_ctx.service_with(students=True)
+    user = await tutor_ctx.new_user()
 
     create_text = await service.create_student(
         user=user,
         cmd=CreateStudentCommand(intent=Intent.CREATE_STUDENT, student_name="Дима", lesson_price=2000),
     )
-    await db_session.commit()
+    await db_session.flush()
     assert "добавлен" in create_text
 
     delete_text = await service.delete_student(
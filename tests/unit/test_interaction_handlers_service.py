@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 
 import pytest
@@ -16,6 +17,7 @@ class _FakeUser:
     timezone: str = "UTC"
 
 
+@dataclass(frozen=True, slots=True)
 class _FakeUsers:
     async def get_or_create(self, telegram_id: int, language: str) -> _FakeUser:
         return _FakeUser(language=language)
@@ -29,21 +31,25 @@ class _FakeSession:
         self.commits += 1
 
 
+@dataclass(frozen=True, slots=True)
 class _FakeParser:
     def parse_payload(self, payload: dict[str, object]) -> object:
         return object()
 
 
+@dataclass(frozen=True, slots=True)
 class _FakeConfirm:
     def is_batch_confirmation(self, action: str | None, payload: dict[str, object]) -> bool:
         return False
 
 
+@dataclass(frozen=True, slots=True)
 class _FakeMemory:
     def build_profile(self, user: object) -> object:
         return object()
 
 
+@dataclass(frozen=True, slots=True)
 class _FakeState:
     async def get_state(self, telegram_id: int) -> object:
         return object()
@@ -52,51 +58,71 @@ class _FakeState:
         return {}
 
 
+@dataclass(frozen=True, slots=True)
 class _FakePending:
     async def handle(self, **kwargs: object) -> tuple[AssistantResponse, bool]:
         return AssistantResponse("pending"), False
 
 
+@dataclass(frozen=True, slots=True)
 class _FakeQuick:
     async def handle(self, **kwargs: object) -> QuickActionOutcome:
         return QuickActionOutcome(response=AssistantResponse(""), delegate_text="делегировать")
 
 
-@pytest.mark.asyncio
-async def test_handle_confirmation_cancelled_returns_cancel_message() -> None:
-    async def _finalize(user: object, source_text: str | None, response: AssistantResponse) -> AssistantResponse:
-        return response
+_USERS = _FakeUsers()
+_PARSER = _FakeParser()
+_CONFIRM = _FakeConfirm()
+_MEMORY = _FakeMemory()
+_STATE = _FakeState()
+_PENDING = _FakePending()
+_QUICK = _FakeQuick()
 
-    async def _execute(user: object, command: object) -> AssistantResponse:
-        return AssistantResponse("ok")
 
-    async def _execute_batch(
-        user: object,
-        operations: list[str],
-        user_memory: object,
-        strategy: str,
-        stop_on_error: bool,
-    ) -> AssistantResponse:
-        return AssistantResponse("batch")
+async def _finalize(user: object, source_text: str | None, response: AssistantResponse) -> AssistantResponse:
+    return response
+
+
+async def _execute(user: object, command: object) -> AssistantResponse:
+    return AssistantResponse("ok")
 
-    async def _handle_text(telegram_id: int, text: str, language: str) -> AssistantResponse:
-        return AssistantResponse(text)
 
-    service = InteractionHandlersService(
+async def _execute_batch(
+    user: object,
+    operations: list[str],
+    user_memory: object,
+    strategy: str,
+    stop_on_error: bool,
+) -> AssistantResponse:
+    return AssistantResponse("batch")
+
+
+def _build_service(
+    handle_text: Callable[[int, str, str], Awaitable[AssistantResponse]],
+) -> InteractionHandlersService:
+    return InteractionHandlersService(
         session=_FakeSession(),  # type: ignore[arg-type]
-        users=_FakeUsers(),  # type: ignore[arg-type]
-        parser=_FakeParser(),  # type: ignore[arg-type]
-        confirmation_service=_FakeConfirm(),  # type: ignore[arg-type]
-        memory=_FakeMemory(),  # type: ignore[arg-type]
-        conversation_state=_FakeState(),  # type: ignore[arg-type]
-        pending_reschedule=_FakePending(),  # type: ignore[arg-type]
-        quick_actions=_FakeQuick(),  # type: ignore[arg-type]
+        users=_USERS,  # type: ignore[arg-type]
+        parser=_PARSER,  # type: ignore[arg-type]
+        confirmation_service=_CONFIRM,  # type: ignore[arg-type]
+        memory=_MEMORY,  # type: ignore[arg-type]
+        conversation_state=_STATE,  # type: ignore[arg-type]
+        pending_reschedule=_PENDING,  # type: ignore[arg-type]
+        quick_actions=_QUICK,  # type: ignore[arg-type]
         finalize_response=_finalize,
         execute_with_disambiguation=_execute,
         execute_batch_with_args=_execute_batch,
-        handle_text=_handle_text,
+        handle_text=handle_text,
     )
 
+
+@pytest.mark.asyncio
+async def test_handle_confirmation_cancelled_returns_cancel_message() -> None:
+    async def _handle_text(telegram_id: int, text: str, language: str) -> AssistantResponse:
+        return AssistantResponse(text)
+
+    service = _build_service(_handle_text)
+
     result = await service.handle_confirmation(
         telegram_id=1,
         language="ru",
@@ -111,21 +137,6 @@ async def test_handle_confirmation_cancelled_returns_cancel_message() -> None:
 
 @pytest.mark.asyncio
 async def test_handle_quick_action_delegates_to_handle_text() -> None:
-    async def _finalize(user: object, source_text: str | None, response: AssistantResponse) -> AssistantResponse:
-        return response
-
-    async def _execute(user: object, command: object) -> AssistantResponse:
-        return AssistantResponse("ok")
-
-    async def _execute_batch(
-        user: object,
-        operations: list[str],
-        user_memory: object,
-        strategy: str,
-        stop_on_error: bool,
-    ) -> AssistantResponse:
-        return AssistantResponse("batch")
-
     captured: dict[str, str] = {}
 
     async def _handle_text(telegram_id: int, text: str, language: str) -> AssistantResponse:
@@ -133,20 +144,7 @@ async def test_handle_quick_action_delegates_to_handle_text() -> None:
         captured["language"] = language
         return AssistantResponse("delegated")
 
-    service = InteractionHandlersService(
-        session=_FakeSession(),  # type: ignore[arg-type]
-        users=_FakeUsers(),  # type: ignore[arg-type]
-        parser=_FakeParser(),  # type: ignore[arg-type]
-        confirmation_service=_FakeConfirm(),  # type: ignore[arg-type]
-        memory=_FakeMemory(),  # type: ignore[arg-type]
-        conversation_state=_FakeState(),  # type: ignore[arg-type]
-        pending_reschedule=_FakePending(),  # type: ignore[arg-type]
-        quick_actions=_FakeQuick(),  # type: ignore[arg-type]
-        finalize_response=_finalize,
-        execute_with_disambiguation=_execute,
-        execute_batch_with_args=_execute_batch,
-        handle_text=_handle_text,
-    )
+    service = _build_service(_handle_text)
 
     result = await service.handle_quick_action(
         telegram_id=1,
@@ -157,4 +155,3 @@ async def test_handle_quick_action_delegates_to_handle_text() -> None:
 
     assert result.text == "delegated"
     assert captured == {"text": "делегировать", "language": "ru"}
-
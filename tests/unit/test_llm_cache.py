@@ -0,0 +1,58 @@
+import pytest
+
+from app.integrations.llm.base import LLMClient
+from app.integrations.llm.cache import CachingLLMClient
+
+
+class CountingLLM(LLMClient):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def complete(self, prompt: str) -> str:
+        self.calls += 1
+        return f"{prompt}:{self.calls}"
+
+
+@pytest.mark.asyncio
+async def test_caching_llm_client_serves_remembered_prompts_from_memory() -> None:
+    inner = CountingLLM()
+    client = CachingLLMClient(inner)
+
+    first = await client.complete("classify")
+    client.remember("classify", first)
+    second = await client.complete("classify")
+
+    assert first == second == "classify:1"
+    assert inner.calls == 1
+    assert client.cache_stats == {"hits": 1, "misses": 1, "size": 1}
+
+
+@pytest.mark.asyncio
+async def test_caching_llm_client_evicts_least_recently_used_entry() -> None:
+    inner = CountingLLM()
+    client = CachingLLMClient(inner, max_entries=2)
+
+    for prompt in ["a", "b", "a", "c", "b"]:
+        client.remember(prompt, await client.complete(prompt))
+
+    assert inner.calls == 4
+    assert client.cache_stats["size"] == 2
+
+
+@pytest.mark.asyncio
+async def test_caching_llm_client_refetches_expired_entries() -> None:
+    inner = CountingLLM()
+    client = CachingLLMClient(inner, ttl_seconds=0.0)
+
+    client.remember("a", await client.complete("a"))
+    assert await client.complete("a") == "a:2"
+
+
+@pytest.mark.asyncio
+async def test_caching_llm_client_does_not_store_unvalidated_responses() -> None:
+    inner = CountingLLM()
+    client = CachingLLMClient(inner)
+
+    assert await client.complete("a") == "a:1"
+    assert await client.complete("a") == "a:2"
+    assert client.cache_stats["size"] == 0
@@ -6,6 +6,7 @@ from app.db.models import Event
 from app.services.reminders.occurrence_service import (
     event_next_occurrence,
     event_occurrences_between,
+    events_starting_before,
 )
 
 
@@ -64,3 +65,64 @@ def test_next_occurrence_returns_none_for_past_one_time() -> None:
 
     assert nxt is None
 
+
+def test_recurring_events_sharing_a_rule_keep_their_own_start() -> None:
+    early, late = (
+        Event(
+            user_id=1,
+            event_type="lesson",
+            title="Math",
+            starts_at=datetime(2026, 3, 2, hour, 0, tzinfo=UTC),
+            rrule="FREQ=WEEKLY;BYDAY=MO",
+            remind_offsets=[15],
+            extra_data={},
+        )
+        for hour in (8, 17)
+    )
+    window = (datetime(2026, 3, 9, 0, 0, tzinfo=UTC), datetime(2026, 3, 17, 0, 0, tzinfo=UTC))
+
+    for _ in range(2):
+        assert event_occurrences_between(early, *window) == [
+            datetime(2026, 3, 9, 8, 0, tzinfo=UTC),
+            datetime(2026, 3, 16, 8, 0, tzinfo=UTC),
+        ]
+        assert event_next_occurrence(late, datetime(2026, 3, 3, 0, 0, tzinfo=UTC)) == datetime(
+            2026, 3, 9, 17, 0, tzinfo=UTC
+        )
+
+
+def test_events_starting_before_cuts_sorted_events_at_window_end() -> None:
+    events = [
+        Event(
+            user_id=1,
+            event_type="reminder",
+            title=str(day),
+            starts_at=datetime(2026, 3, day, 8, 0, tzinfo=UTC),
+            rrule=None,
+            remind_offsets=[0],
+            extra_data={},
+        )
+        for day in (1, 2, 3, 4)
+    ]
+
+    kept = events_starting_before(events, datetime(2026, 3, 3, 7, 59, tzinfo=UTC))
+
+    assert [event.title for event in kept] == ["1", "2"]
+
+
+def test_recurring_event_starting_exactly_at_window_end_is_kept() -> None:
+    window_end = datetime(2026, 3, 3, 0, 0, tzinfo=UTC)
+    lesson = Event(
+        user_id=1,
+        event_type="lesson",
+        title="Math",
+        starts_at=window_end,
+        rrule="FREQ=WEEKLY;BYDAY=TU",
+        remind_offsets=[15],
+        extra_data={},
+    )
+
+    kept = events_starting_before([lesson], window_end)
+
+    assert kept == [lesson]
+    assert event_occurrences_between(lesson, datetime(2026, 3, 2, 0, 0, tzinfo=UTC), window_end) == [window_end]
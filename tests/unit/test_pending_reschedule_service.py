@@ -7,6 +7,11 @@ import pytest
 
 from app.db.models import User
 from app.services.assistant.pending_reschedule_service import PendingRescheduleService
+from app.services.events.event_service import EventService
+from app.services.parser.command_parser_service import CommandParserService
+
+_UNUSED_PARSER = cast(CommandParserService, object())
+_UNUSED_EVENTS = cast(EventService, object())
 
 
 class _FakeEvents:
@@ -25,8 +30,8 @@ async def _ask_clarification(**_: object) -> str:
 @pytest.mark.asyncio
 async def test_pending_reschedule_handle_rejects_non_user() -> None:
     service = PendingRescheduleService(
-        parser=cast(object, object()),
-        events=cast(object, object()),
+        parser=_UNUSED_PARSER,
+        events=_UNUSED_EVENTS,
         ask_clarification=_ask_clarification,
     )
 
@@ -43,18 +48,17 @@ async def test_pending_reschedule_handle_rejects_non_user() -> None:
 
 
 @pytest.mark.asyncio
-async def test_pending_reschedule_quick_pick_valid_payload() -> None:
+async def test_pending_reschedule_quick_pick_valid_payload(ru_user: User) -> None:
     events = _FakeEvents()
     service = PendingRescheduleService(
-        parser=cast(object, object()),
-        events=cast(object, events),
+        parser=_UNUSED_PARSER,
+        events=cast(EventService, events),
         ask_clarification=_ask_clarification,
     )
-    user = User(telegram_id=1, language="ru", timezone="Europe/Moscow")
     event_id = uuid4()
 
     response, should_commit = await service.quick_pick(
-        user=user,
+        user=ru_user,
         payload={
             "event_id": str(event_id),
             "new_date": "2026-03-10",
@@ -59,8 +59,8 @@ async def test_route_uses_orchestrator_when_memory_profile_exists() -> None:
     memory = UserMemoryProfile(
         timezone="UTC",
         locale="ru",
-        default_offsets=[0],
-        work_days=[1, 2, 3, 4, 5],
+        default_offsets=(0,),
+        work_days=(1, 2, 3, 4, 5),
         time_format_24h=True,
     )
 
@@ -86,8 +86,8 @@ async def test_assess_plan_risk_prefers_orchestrator() -> None:
     memory = UserMemoryProfile(
         timezone="UTC",
         locale="ru",
-        default_offsets=[0],
-        work_days=[1, 2, 3, 4, 5],
+        default_offsets=(0,),
+        work_days=(1, 2, 3, 4, 5),
         time_format_24h=True,
     )
 
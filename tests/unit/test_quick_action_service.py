@@ -6,7 +6,9 @@ import pytest
 
 from app.db.models import User
 from app.services.assistant.assistant_response import AssistantResponse
+from app.services.assistant.pending_reschedule_service import PendingRescheduleService
 from app.services.assistant.quick_action_service import QuickActionService
+from app.services.events.event_service import EventService
 
 
 class _FakeEvents:
@@ -19,15 +21,19 @@ class _FakePendingReschedule:
         return AssistantResponse("rescheduled"), True
 
 
+_EVENTS = cast(EventService, _FakeEvents())
+_PENDING_RESCHEDULE = cast(PendingRescheduleService, _FakePendingReschedule())
+
+
 @pytest.mark.asyncio
-async def test_quick_action_service_send_text_choice_returns_delegate() -> None:
+async def test_quick_action_service_send_text_choice_returns_delegate(ru_user: User) -> None:
     service = QuickActionService(
-        events=cast(object, _FakeEvents()),
-        pending_reschedule=cast(object, _FakePendingReschedule()),
+        events=_EVENTS,
+        pending_reschedule=_PENDING_RESCHEDULE,
     )
 
     outcome = await service.handle(
-        user=User(telegram_id=1, language="ru", timezone="UTC"),
+        user=ru_user,
         action="send_text_choice",
         payload={"text": "покажи сегодня"},
     )
@@ -37,14 +43,14 @@ async def test_quick_action_service_send_text_choice_returns_delegate() -> None:
 
 
 @pytest.mark.asyncio
-async def test_quick_action_service_reschedule_pick_commit() -> None:
+async def test_quick_action_service_reschedule_pick_commit(ru_user: User) -> None:
     service = QuickActionService(
-        events=cast(object, _FakeEvents()),
-        pending_reschedule=cast(object, _FakePendingReschedule()),
+        events=_EVENTS,
+        pending_reschedule=_PENDING_RESCHEDULE,
     )
 
     outcome = await service.handle(
-        user=User(telegram_id=1, language="ru", timezone="UTC"),
+        user=ru_user,
         action="reschedule_pick",
         payload={"event_id": "x"},
     )
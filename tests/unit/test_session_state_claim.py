@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from app.services.stores.pending_action_store import PendingAction, PendingActionStore
+from app.services.stores.session_state_store import SessionStateStore
+
+
+@pytest.mark.asyncio
+async def test_claim_and_load_pending_claims_each_update_once(fake_redis: Any) -> None:
+    store = SessionStateStore(fake_redis)
+    pending = PendingAction(action="reschedule_lesson", event_id=uuid4())
+    await PendingActionStore(fake_redis).put(1, pending)
+
+    assert await store.claim_and_load_pending("msg:text:1:1:1", 1) == (True, pending)
+    assert await store.claim_and_load_pending("msg:text:1:1:1", 1) == (False, None)
+    assert await store.claim_and_load_pending("msg:text:1:1:2", 1) == (True, pending)
+
+
+@pytest.mark.asyncio
+async def test_claim_and_load_pending_survives_malformed_blob(fake_redis: Any) -> None:
+    store = SessionStateStore(fake_redis)
+    await fake_redis.set(PendingActionStore(fake_redis).key(2), "{not json", ex=60)
+
+    assert await store.claim_and_load_pending("msg:text:2:2:1", 2) == (True, None)
+    assert await store.claim_and_load_pending("msg:text:2:2:1", 2) == (False, None)
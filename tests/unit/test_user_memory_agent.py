@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from app.db.models import User
+from app.services.smart_agents import UserMemoryAgent
+
+
+def test_build_profile_for_unflushed_user_without_work_days() -> None:
+    user = User(telegram_id=1, language="ru", timezone="Europe/Moscow")
+
+    profile = UserMemoryAgent().build_profile(user)
+
+    assert profile.work_days == ()
+    assert profile.timezone == "Europe/Moscow"